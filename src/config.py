@@ -3,89 +3,124 @@
 
 """
 Configuration file, defines system constants and configuration items
+
+Mappings are exposed as read-only MappingProxyType views and sequences as tuples,
+any attempt to modify them raises TypeError.
 """
 
+import sys
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from typing import Final, Tuple
+
 # Time slot definitions, each time slot is 30 minutes
-TIME_SLOTS = {
-    0: "09:00-09:30",
-    1: "09:30-10:00",
-    2: "10:00-10:30",
-    3: "10:30-11:00",
-    4: "11:00-11:30",
-    5: "11:30-12:00",
-    6: "13:00-13:30",
-    7: "13:30-14:00",
-    8: "14:00-14:30",
-    9: "14:30-15:00",
-    10: "15:00-15:30",
-    11: "15:30-16:00",
-    12: "16:00-16:30",
-    13: "16:30-17:00",
-    14: "17:00-17:30",
-    15: "17:30-18:00"
-}
-
-# Hexadecimal bit positions corresponding to time slots
-# Example: 0x8000 indicates available only at 09:00-09:30
+# TIME_SLOTS[i] is the label of slot i (0-15)
+TIME_SLOTS: Final[Tuple[str, ...]] = (
+    "09:00-09:30",
+    "09:30-10:00",
+    "10:00-10:30",
+    "10:30-11:00",
+    "11:00-11:30",
+    "11:30-12:00",
+    "13:00-13:30",
+    "13:30-14:00",
+    "14:00-14:30",
+    "14:30-15:00",
+    "15:00-15:30",
+    "15:30-16:00",
+    "16:00-16:30",
+    "16:30-17:00",
+    "17:00-17:30",
+    "17:30-18:00"
+)
+NUM_SLOTS: Final[int] = 16
+assert len(TIME_SLOTS) == NUM_SLOTS
+
+# Slot index range reused by loops instead of building range(len(TIME_SLOTS)) each call
+SLOT_INDICES: Final[Tuple[int, ...]] = tuple(range(NUM_SLOTS))
+
+# Schedule format: doctor_schedules.csv stores one 16-bit mask per doctor, date and clinic,
+# written as a hexadecimal string (e.g. "0xFF00") in the time_slots column.
+
+# Hexadecimal bit positions corresponding to time slots, least significant bit first,
+# the same order DoctorSchedule and DateUtil.hex_to_time_slots read the stored masks in
+# Example: 0x0001 indicates available only in the first slot of the day
 # 0xFFFF indicates available all day
 # 0x0000 indicates not available all day
-HEX_TIME_SLOTS = {
-    0: 0x8000,  # 09:00-09:30
-    1: 0x4000,  # 09:30-10:00
-    2: 0x2000,  # 10:00-10:30
-    3: 0x1000,  # 10:30-11:00
-    4: 0x0800,  # 11:00-11:30
-    5: 0x0400,  # 11:30-12:00
-    6: 0x0200,  # 13:00-13:30
-    7: 0x0100,  # 13:30-14:00
-    8: 0x0080,  # 14:00-14:30
-    9: 0x0040,  # 14:30-15:00
-    10: 0x0020,  # 15:00-15:30
-    11: 0x0010,  # 15:30-16:00
-    12: 0x0008,  # 16:00-16:30
-    13: 0x0004,  # 16:30-17:00
-    14: 0x0002,  # 17:00-17:30
-    15: 0x0001   # 17:30-18:00
-}
-
-# Common time slot combinations
-MORNING_SLOTS = 0xFC00  # 09:00-12:00
-AFTERNOON_SLOTS = 0x03FF  # 13:00-18:00
-ALL_DAY_SLOTS = 0xFFFF  # All day
-NO_SLOTS = 0x0000  # Not available
-
-# Appointment status
-APPOINTMENT_STATUS = {
-    "SCHEDULED": "Scheduled",
-    "COMPLETED": "Completed",
-    "CANCELLED_BY_PATIENT": "Cancelled by Patient",
-    "CANCELLED_BY_CLINIC": "Cancelled by Clinic"
-}
+# HEX_TIME_SLOTS[i] is the bit for slot i (0x0001 for slot 0 ... 0x8000 for slot 15)
+HEX_TIME_SLOTS: Final[Tuple[int, ...]] = tuple(1 << i for i in SLOT_INDICES)
+
+
+def slot_mask(slot: int) -> int:
+    """Get the bit mask of a time slot
+
+    Args:
+        slot (int): Time slot index (0-15)
+
+    Returns:
+        int: Bit mask of the time slot, e.g. 0x0001 for slot 0
+    """
+    return 1 << slot
+
+
+# Common time slot combinations, slot 0 is the lowest bit
+MORNING_SLOTS: Final[int] = 0x003F  # Slots 0-5
+AFTERNOON_SLOTS: Final[int] = 0xFFC0  # Slots 6-15
+ALL_DAY_SLOTS: Final[int] = 0xFFFF  # All day
+NO_SLOTS: Final[int] = 0x0000  # Not available
+
+# Every schedule mask is exactly NUM_SLOTS bits wide, so it always fits in an unsigned 16-bit value
+SLOT_MASK: Final[int] = (1 << NUM_SLOTS) - 1  # 0xFFFF
+assert ALL_DAY_SLOTS == SLOT_MASK
+assert HEX_TIME_SLOTS[0] == 1 and HEX_TIME_SLOTS[-1].bit_length() == NUM_SLOTS
+assert MORNING_SLOTS | AFTERNOON_SLOTS == SLOT_MASK
+assert MORNING_SLOTS & AFTERNOON_SLOTS == 0
+
+# Appointment status, use attribute access, e.g. STATUS.SCHEDULED
+STATUS = SimpleNamespace(
+    SCHEDULED="Scheduled",
+    COMPLETED="Completed",
+    CANCELLED_BY_PATIENT="Cancelled by Patient",
+    CANCELLED_BY_CLINIC="Cancelled by Clinic"
+)
+
+# Intern the labels so they share identity with labels interned while loading CSV rows
+# (literals in source are only interned automatically when they look like identifiers)
+for _key, _label in list(vars(STATUS).items()):
+    setattr(STATUS, _key, sys.intern(_label))
+
+# Read-only dictionary view kept for existing key-based lookups, over a copy so that
+# assigning to a STATUS attribute cannot change it
+APPOINTMENT_STATUS = MappingProxyType(dict(vars(STATUS)))
 
 # Appointment reasons
-APPOINTMENT_REASONS = {
-    "GENERAL": "General Consultation",
-    "VACCINATION": "Vaccination",
-    "REFERRAL": "Referral",
-    "CHRONIC": "Chronic Disease Management",
-    "MENTAL": "Mental Health Consultation",
-    "OTHER": "Other"
-}
+APPOINTMENT_REASONS = MappingProxyType({
+    "GENERAL": sys.intern("General Consultation"),
+    "VACCINATION": sys.intern("Vaccination"),
+    "REFERRAL": sys.intern("Referral"),
+    "CHRONIC": sys.intern("Chronic Disease Management"),
+    "MENTAL": sys.intern("Mental Health Consultation"),
+    "OTHER": sys.intern("Other")
+})
 
 # Clinic service configuration
 # Since the services field was removed from clinics.csv, define clinic services here
-CLINIC_SERVICES = {
-    1: ["General Consultation", "Vaccination", "Referral", "Chronic Disease Management", "Mental Health Consultation"],
-    2: ["General Consultation", "Vaccination", "Referral", "Chronic Disease Management"],
-    3: ["General Consultation", "Vaccination", "Mental Health Consultation"]
-}
-
-# Data file paths
-DATA_DIR = "../data"
-USERS_FILE = f"{DATA_DIR}/users.csv"
-DOCTORS_FILE = f"{DATA_DIR}/doctors.csv"
-CLINICS_FILE = f"{DATA_DIR}/clinics.csv"
-APPOINTMENTS_FILE = f"{DATA_DIR}/appointments.csv"
-DOCTOR_SCHEDULES_FILE = f"{DATA_DIR}/doctor_schedules.csv"
-NOTIFICATIONS_FILE = f"{DATA_DIR}/notifications.csv"
-APPOINTMENT_REASONS_FILE = f"{DATA_DIR}/appointment_reasons.csv"
+# CLINIC_SERVICES_ORDERED keeps the display order, CLINIC_SERVICES is used for membership tests
+CLINIC_SERVICES_ORDERED = MappingProxyType({
+    1: tuple(sys.intern(s) for s in ("General Consultation", "Vaccination", "Referral", "Chronic Disease Management", "Mental Health Consultation")),
+    2: tuple(sys.intern(s) for s in ("General Consultation", "Vaccination", "Referral", "Chronic Disease Management")),
+    3: tuple(sys.intern(s) for s in ("General Consultation", "Vaccination", "Mental Health Consultation"))
+})
+CLINIC_SERVICES = MappingProxyType(
+    {clinic_id: frozenset(services) for clinic_id, services in CLINIC_SERVICES_ORDERED.items()}
+)
+
+# Data file paths, resolved once against the project root so they do not depend on the working directory
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+USERS_FILE = DATA_DIR / "users.csv"
+DOCTORS_FILE = DATA_DIR / "doctors.csv"
+CLINICS_FILE = DATA_DIR / "clinics.csv"
+APPOINTMENTS_FILE = DATA_DIR / "appointments.csv"
+DOCTOR_SCHEDULES_FILE = DATA_DIR / "doctor_schedules.csv"
+NOTIFICATIONS_FILE = DATA_DIR / "notifications.csv"
+APPOINTMENT_REASONS_FILE = DATA_DIR / "appointment_reasons.csv"
@@ -5,16 +5,212 @@
 Appointment Controller - Handles appointment-related UI and interactions
 """
 
-import os
+from __future__ import annotations
+import sys
+import unicodedata
+from datetime import date, timedelta
+from enum import Enum
 from typing import Optional, Dict, Any, Tuple, List
 
 from src.entities.user import User
 from src.services.appointment_service import AppointmentService
 from src.utils.date_util import DateUtil
+from src.utils.screen_util import ScreenUtil
+
+# Table row templates, headers are rendered from the same template so columns always line up
+_CLINIC_ROW_FMT = "{id:<5}{name:<15}{suburb:<10}{address:<20}{phone:<15}"
+_CLINIC_HEADER = _CLINIC_ROW_FMT.format(id="ID", name="Name", suburb="Suburb", address="Address", phone="Phone")
+
+_DOCTOR_ROW_FMT = "{id:<5}{full_name:<15}{email:<25}{specialisation:<20}"
+_DOCTOR_HEADER = _DOCTOR_ROW_FMT.format(id="ID", full_name="Name", email="Email", specialisation="Specialisation")
+
+_DATE_ROW_FMT = "{date:<15}{day_of_week:<10}"
+_DATE_HEADER = _DATE_ROW_FMT.format(date="Date", day_of_week="Day of Week")
+
+_SLOT_HEADER = f"{'Date':<15}{'Day of Week':<10}{'Clinic':<15}{'Doctor':<15}{'Available Time'}"
+
+_MY_APPOINTMENT_ROW_FMT = "{id:<5}{date:<15}{time_str:<20}{clinic_name:<15}{doctor_name:<15}{status:<15}"
+_MY_APPOINTMENT_HEADER = _MY_APPOINTMENT_ROW_FMT.format(
+    id="ID", date="Date", time_str="Time", clinic_name="Clinic", doctor_name="Doctor", status="Status")
+
+_ALL_APPOINTMENT_ROW_FMT = "{id:<5}{user_id:<8}{date:<12}{time_str:<18}{doctor_name:<15}{clinic_name:<15}{status:<12}"
+_ALL_APPOINTMENT_HEADER = _ALL_APPOINTMENT_ROW_FMT.format(
+    id="ID", user_id="User ID", date="Date", time_str="Time", doctor_name="Doctor", clinic_name="Clinic", status="Status")
+
+_FILTERED_APPOINTMENT_ROW_FMT = "{id:<5}{user_id:<8}{date:<15}{time_str:<20}{clinic_name:<15}{doctor_name:<15}{status:<15}"
+_FILTERED_APPOINTMENT_HEADER = _FILTERED_APPOINTMENT_ROW_FMT.format(
+    id="ID", user_id="User ID", date="Date", time_str="Time", clinic_name="Clinic", doctor_name="Doctor", status="Status")
+
+
+# Appointment detail blocks, filled from get_appointment_details results
+_DETAILS_FMT = (
+    "Appointment ID: {id}\n"
+    "User ID: {user_id}\n"
+    "Patient Name: {user_name}\n"
+    "Patient Email: {user_email}\n"
+    "Date: {date}\n"
+    "Time: {time_str}\n"
+    "Clinic: {clinic_name}\n"
+    "Clinic Address: {clinic_address}\n"
+    "Doctor: {doctor_name}\n"
+    "Appointment Reason: {reason}\n"
+    "Status: {status}\n"
+)
+_CANCEL_DETAILS_FMT = (
+    "\nAppointment Details:\n"
+    "ID: {id}\n"
+    "User ID: {user_id}\n"
+    "Patient Name: {user_name}\n"
+    "Date: {date}\n"
+    "Time: {time_str}\n"
+    "Clinic: {clinic_name}\n"
+    "Doctor: {doctor_name}\n"
+    "Current Status: {status}\n"
+)
+
+# Table heads (header line plus the separator under it) and the rule above screen titles
+_CLINIC_TABLE_HEAD = f"{_CLINIC_HEADER}\n{'-' * 65}\n"
+_DOCTOR_TABLE_HEAD = f"{_DOCTOR_HEADER}\n{'-' * 65}\n"
+_DATE_TABLE_HEAD = f"{_DATE_HEADER}\n{'-' * 25}\n"
+_SLOT_TABLE_HEAD = f"{_SLOT_HEADER}\n{'-' * 85}\n"
+_MY_APPOINTMENT_TABLE_HEAD = f"{_MY_APPOINTMENT_HEADER}\n{'-' * 85}\n"
+_ALL_APPOINTMENT_TABLE_HEAD = f"{_ALL_APPOINTMENT_HEADER}\n{'-' * 90}\n"
+_FILTERED_APPOINTMENT_TABLE_HEAD = f"{_FILTERED_APPOINTMENT_HEADER}\n{'-' * 95}\n"
+_TITLE_RULE = "=" * 50 + "\n"
+
+
+def _header_text(title: str) -> str:
+    """Render a screen header, centring the title by terminal columns
+    
+    Wide (e.g. CJK) characters take two columns, so the title is centred
+    in correspondingly fewer characters.
+    
+    Args:
+        title (str): Screen title
+        
+    Returns:
+        str: Title rule, centred title and blank line
+    """
+    extra = sum(1 for ch in title if unicodedata.east_asian_width(ch) in "WF")
+    return f"{_TITLE_RULE}{title.center(48 - extra)}\n\n"
+
+
+# Rendered headers by title, filled on first use of each title
+_HEADERS: Dict[str, str] = {}
+
+
+def _selection_prompts(subject: str, all_text: str, default_text: str) -> Dict[bool, str]:
+    """Build the selection prompt for both values of default_option
+    
+    Args:
+        subject (str): Leading instruction, e.g. "Select clinic ID"
+        all_text (str): What 0 selects when a default option is offered
+        default_text (str): What pressing Enter does
+        
+    Returns:
+        Dict[bool, str]: Prompt keyed by default_option
+    """
+    tail = f", enter - to return to main menu, press Enter to {default_text}: "
+    return {
+        True: f"\n{subject}, or enter 0 to view all {all_text}/return{tail}",
+        False: f"\n{subject}, or enter 0 to return{tail}",
+    }
+
+
+_CLINIC_PROMPTS = _selection_prompts("Select clinic ID", "clinics", "view all clinics by default")
+_DOCTOR_PROMPTS = _selection_prompts("Select doctor ID", "doctors", "view all doctors by default")
+# Contains a {today} field, filled in per call
+_DATE_PROMPTS = _selection_prompts("Enter date (YYYY-MM-DD)", "dates", "select today ({today})")
+
+
+class NavAction(Enum):
+    """Navigation outcome of a menu input"""
+    MAIN = "main"        # "-": return to main menu
+    BACK = "back"        # "0": return to previous menu
+    DEFAULT = "default"  # Enter: take the default option
+    YES = "yes"          # "Y" at a confirmation prompt
+    NO = "no"            # "N" at a confirmation prompt
+    VALUE = "value"      # Anything else: an actual selection
+
+
+_NAV = {"-": NavAction.MAIN, "0": NavAction.BACK, "": NavAction.DEFAULT}
+# Confirmation prompts also accept Y/N (input is upper-cased first)
+_CONFIRM_NAV = {**_NAV, "Y": NavAction.YES, "N": NavAction.NO}
+
+# Search menu filters as bit flags, each menu choice maps to the flags it applies
+_SEARCH_BY_CLINIC = 1
+_SEARCH_BY_DOCTOR = 2
+_SEARCH_BY_DATE = 4
+_SEARCH_MASKS = {
+    "1": _SEARCH_BY_CLINIC,
+    "2": _SEARCH_BY_DOCTOR,
+    "3": _SEARCH_BY_DATE,
+    "4": _SEARCH_BY_CLINIC | _SEARCH_BY_DOCTOR,
+    "5": _SEARCH_BY_CLINIC | _SEARCH_BY_DATE,
+    "6": _SEARCH_BY_DOCTOR | _SEARCH_BY_DATE,
+    "7": _SEARCH_BY_CLINIC | _SEARCH_BY_DOCTOR | _SEARCH_BY_DATE,
+}
+
+# Menu screens, each written in one piece
+_APPOINTMENT_MENU = (
+    "1. Query available time slot and book\n"
+    "2. View all my appointments\n"
+    "3. View upcoming appointments\n"
+    "4. View history appointments\n"
+    "5. Search appointments\n"
+    "0. Return to previous menu\n"
+    "-. Return to main menu\n"
+)
+_ADMIN_MENU = (
+    "1. View all appointments\n"
+    "2. Filter appointments by condition\n"
+    "3. Cancel appointment by ID\n"
+    "0. Return to previous menu\n"
+    "-. Return to main menu\n"
+)
+_SEARCH_MENU = (
+    "Select filtering condition:\n"
+    "1. Filter by clinic\n"
+    "2. Filter by doctor\n"
+    "3. Filter by date\n"
+    "4. Filter by clinic and doctor\n"
+    "5. Filter by clinic and date\n"
+    "6. Filter by doctor and date\n"
+    "7. Filter by clinic, doctor, and date\n"
+    "0. Return to previous menu\n"
+    "-. Return to main menu\n"
+)
+_CANCELLABLE_DETAILS_MENU = (
+    "\n1. Cancel Appointment\n"
+    "0. Return to previous menu\n"
+    "-. Return to main menu\n"
+)
+_DETAILS_MENU = (
+    "\n0. Return to previous menu\n"
+    "-. Return to main menu\n"
+)
+
 
 class AppointmentController:
     """Appointment Controller - Handles appointment-related UI and interactions"""
     
+    # Read prompts through input() for readline editing/history instead of plain stdin reads
+    _line_editing = False
+    
+    # Menu option -> action, called with the controller (and the user for the appointment menu)
+    _MENU_ACTIONS = {
+        "1": lambda self, user: self.make_appointment(user),
+        "2": lambda self, user: self.show_appointments(user),
+        "3": lambda self, user: self.show_appointments(user, future_only=True),
+        "4": lambda self, user: self.show_appointments(user, history_only=True),
+        "5": lambda self, user: self.search_appointments(user),
+    }
+    _ADMIN_ACTIONS = {
+        "1": lambda self: self._show_all_appointments(),
+        "2": lambda self: self._search_as_admin(),
+        "3": lambda self: self._cancel_by_id(),
+    }
+    
     def __init__(self, user=None):
         """Initialize appointment controller
         
@@ -24,10 +220,117 @@ class AppointmentController:
         self.__appointment_service = AppointmentService()
         self.__current_user = user
         self.__should_return_to_main = False  # Flag to return to main menu
-        self.__DateUtil = DateUtil()
+        # Clinic/doctor lists and by-ID lookups, loaded on first use and kept while the data files are unchanged
+        self.__cache_mtime = None
+        self.__clinic_cache = None
+        self.__doctor_cache = None
+        self.__clinic_by_id = None
+        self.__doctor_by_id = None
+        # Date selection windows keyed by (today, future_only), only the current day is kept
+        self.__date_windows = {}
+    
+    def _check_data_mtime(self) -> None:
+        """Invalidate the clinic/doctor caches if the data files changed since they were loaded"""
+        mtime = self.__appointment_service.get_data_mtime()
+        if mtime != self.__cache_mtime:
+            self._invalidate_caches()
+            self.__cache_mtime = mtime
+    
+    def _clinics(self) -> List:
+        """Get all clinics, loaded once and reused until caches are invalidated
+        
+        Returns:
+            List: List of clinics
+        """
+        self._check_data_mtime()
+        if self.__clinic_cache is None:
+            self.__clinic_cache = self.__appointment_service.get_all_clinics()
+            self.__clinic_by_id = {clinic.id: clinic for clinic in self.__clinic_cache}
+        return self.__clinic_cache
+    
+    def _doctors(self) -> List:
+        """Get all doctors, loaded once and reused until caches are invalidated
+        
+        Returns:
+            List: List of doctors
+        """
+        self._check_data_mtime()
+        if self.__doctor_cache is None:
+            self.__doctor_cache = self.__appointment_service.get_all_doctors()
+            self.__doctor_by_id = {doctor.id: doctor for doctor in self.__doctor_cache}
+        return self.__doctor_cache
+    
+    def _clinic(self, clinic_id: int):
+        """Get clinic by ID from the cache
+        
+        Args:
+            clinic_id (int): Clinic ID
+            
+        Returns:
+            Clinic: Clinic object, None if not found
+        """
+        self._clinics()
+        return self.__clinic_by_id.get(clinic_id)
+    
+    def _doctor(self, doctor_id: int):
+        """Get doctor by ID from the cache
+        
+        Args:
+            doctor_id (int): Doctor ID
+            
+        Returns:
+            Doctor: Doctor object, None if not found
+        """
+        self._doctors()
+        return self.__doctor_by_id.get(doctor_id)
+    
+    def _doctors_by_clinic(self, clinic_id: int) -> List:
+        """Get doctors working at a clinic from the cache
+        
+        Args:
+            clinic_id (int): Clinic ID
+            
+        Returns:
+            List: List of doctors
+        """
+        return [doctor for doctor in self._doctors() if doctor.is_working_in_clinic(clinic_id)]
+    
+    def _date_window(self, today_date: date, future_only: bool) -> List[str]:
+        """Get the formatted date rows for the selection window, built once per day
+        
+        Args:
+            today_date (date): Today's date
+            future_only (bool): Whether the window is the next 7 days only
+            
+        Returns:
+            List[str]: Formatted date rows
+        """
+        key = (today_date, future_only)
+        rows = self.__date_windows.get(key)
+        if rows is None:
+            # A new day makes every cached window stale
+            if any(cached_day != today_date for cached_day, _ in self.__date_windows):
+                self.__date_windows.clear()
+            if future_only:
+                date_rows = self.__appointment_service.get_date_rows(today_date, 7)
+            else:
+                date_rows = self.__appointment_service.get_date_rows(today_date - timedelta(days=7), 14)
+            rows = [_DATE_ROW_FMT.format(date=date_str, day_of_week=day_of_week)
+                    for _, date_str, day_of_week in date_rows]
+            self.__date_windows[key] = rows
+        return rows
+    
+    def _invalidate_caches(self) -> None:
+        """Drop cached clinic/doctor data so it is reloaded on next use"""
+        self.__clinic_cache = None
+        self.__doctor_cache = None
+        self.__clinic_by_id = None
+        self.__doctor_by_id = None
+        self.__appointment_service.clear_lookup_cache()
+    
     def clear_screen(self):
         """Clear screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        ScreenUtil.clear_screen()
     
     def print_header(self, title):
         """Print title header
@@ -36,13 +339,44 @@ class AppointmentController:
             title (str): The title to display
         """
         self.clear_screen()
-        print("=" * 50)
-        print(f"{title.center(48)}")
-        print()
+        header = _HEADERS.get(title)
+        if header is None:
+            header = _HEADERS[title] = _header_text(title)
+        sys.stdout.write(header)
+    
+    def _prompt(self, message: str = "") -> str:
+        """Show a prompt and read one line of input
+        
+        Args:
+            message (str): Prompt text
+            
+        Returns:
+            str: Input line without the trailing newline
+            
+        Raises:
+            EOFError: If input is exhausted, as with input()
+        """
+        if self._line_editing:
+            return input(message)
+        sys.stdout.write(message)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError("EOF when reading a line")
+        return line.rstrip("\n")
+    
+    def _write_table(self, head: str, rows: List[str]) -> None:
+        """Write a table head and rows with a single write
+        
+        Args:
+            head (str): Precomputed header and separator lines, newline terminated
+            rows (List[str]): Formatted rows
+        """
+        sys.stdout.write(head + "\n".join(rows) + "\n")
     
     def wait_for_key(self):
         """Wait for user to press a key"""
-        input("\nPress Enter to continue...")
+        self._prompt("\nPress Enter to continue...")
     
     def print_navigation_options(self, has_default=True, default_text=""):
         """Print navigation options
@@ -51,10 +385,10 @@ class AppointmentController:
             has_default (bool): Whether to show default option
             default_text (str): Text for default option
         """
-        print("\n0. Return")
-        print("-. Back to Main Menu")
+        text = "\n0. Return\n-. Back to Main Menu\n"
         if has_default and default_text:
-            print(f"Press Enter to {default_text}")
+            text += f"Press Enter to {default_text}\n"
+        sys.stdout.write(text)
     
     def handle_navigation_choice(self, choice: str) -> int:
         """Handle navigation choice
@@ -65,10 +399,42 @@ class AppointmentController:
         Returns:
             int: 0 means return to previous menu, -1 means return to main menu, other values are actual selections
         """
-        if choice == "-":
-            self.__should_return_to_main = True
+        action = self._nav_action(choice)
+        if action is NavAction.MAIN:
             return -1
-        return 0 if choice == "0" else 1
+        return 0 if action is NavAction.BACK else 1
+    
+    def _nav_action(self, choice: str, table: Dict[str, NavAction] = _NAV) -> NavAction:
+        """Classify a menu input, flagging a return to main menu for "-"
+        
+        Args:
+            choice (str): User input
+            table (Dict[str, NavAction]): Input to action table, _CONFIRM_NAV for Y/N prompts
+            
+        Returns:
+            NavAction: Navigation action for the input
+        """
+        action = table.get(choice, NavAction.VALUE)
+        if action is NavAction.MAIN:
+            self.__should_return_to_main = True
+        return action
+    
+    @staticmethod
+    def _parse_int_choice(choice: str) -> Optional[int]:
+        """Parse a numeric menu choice without raising
+        
+        Args:
+            choice (str): User input
+            
+        Returns:
+            Optional[int]: Parsed integer, None if the input is not a number
+        """
+        choice = choice.strip()
+        # int() accepts one leading sign, so "+5" and "-1" stay valid choices
+        digits = choice[1:] if choice.startswith(('+', '-')) else choice
+        if not digits.isdecimal():
+            return None
+        return int(choice)
     
     def get_clinic_selection(self, default_option: bool = True) -> Optional[int]:
         """Display clinic selection interface
@@ -80,55 +446,39 @@ class AppointmentController:
             Optional[int]: Selected clinic ID, returns None if all clinics selected
                           Returns -1 to go back, if self.__should_return_to_main is True then return to main menu
         """
-        self.print_header("Select Clinic")
+        clinics = self._clinics()
         
-        clinics = self.__appointment_service.get_all_clinics()
+        self.print_header("Select Clinic")
         
         if not clinics:
             print("No clinic records found")
             self.wait_for_key()
             return -1
         
-        print(f"{'ID':<5}{'Name':<15}{'Suburb':<10}{'Address':<20}{'Phone':<15}")
-        print("-" * 65)
-        
-        for clinic in clinics:
-            print(f"{clinic.id:<5}{clinic.name:<15}{clinic.suburb:<10}{clinic.address:<20}{clinic.phone:<15}")
-        
-        option_text = "\nSelect clinic ID"
-        if default_option:
-            option_text += ", or enter 0 to view all clinics/return"
-        else:
-            option_text += ", or enter 0 to return"
-        option_text += ", enter - to return to main menu"
-        option_text += ", press Enter to view all clinics by default: "
+        rows = [_CLINIC_ROW_FMT.format(id=clinic.id, name=clinic.name, suburb=clinic.suburb,
+                                       address=clinic.address, phone=clinic.phone)
+                for clinic in clinics]
+        self._write_table(_CLINIC_TABLE_HEAD, rows)
         
-        print(option_text, end="")
-        choice = input()
-        
-        if choice == "":
-            return None  # Press Enter to view all clinics by default
-        
-        if choice == "-":
-            self.__should_return_to_main = True
-            return -1
-        
-        if choice == "0":
-            return -1 if not default_option else None
-        
-        try:
-            clinic_id = int(choice)
-            selected_clinic = self.__appointment_service.get_clinic_by_id(clinic_id)
-            if selected_clinic:
+        # Invalid input only prints an error line and prompts again, the table stays on screen
+        while True:
+            choice = self._prompt(_CLINIC_PROMPTS[default_option])
+            
+            action = self._nav_action(choice)
+            if action is NavAction.DEFAULT:
+                return None  # Press Enter to view all clinics by default
+            if action is NavAction.MAIN:
+                return -1
+            if action is NavAction.BACK:
+                return -1 if not default_option else None
+            
+            clinic_id = self._parse_int_choice(choice)
+            if clinic_id is None:
+                print("Please enter a valid number")
+            elif self._clinic(clinic_id):
                 return clinic_id
             else:
                 print("Invalid clinic ID")
-                self.wait_for_key()
-                return self.get_clinic_selection(default_option)
-        except ValueError:
-            print("Please enter a valid number")
-            self.wait_for_key()
-            return self.get_clinic_selection(default_option)
     
     def get_doctor_selection(self, clinic_id: Optional[int] = None, default_option: bool = True) -> Optional[int]:
         """Display doctor selection interface
@@ -141,13 +491,13 @@ class AppointmentController:
             Optional[int]: Selected doctor ID, returns None if all doctors selected
                           Returns -1 to go back, if self.__should_return_to_main is True then return to main menu
         """
+        doctors = self._doctors_by_clinic(clinic_id) if clinic_id else self._doctors()
+        
         self.print_header("Select Doctor")
         
         if clinic_id:
-            doctors = self.__appointment_service.get_doctors_by_clinic(clinic_id)
             print(f"Doctors at clinic {clinic_id}:")
         else:
-            doctors = self.__appointment_service.get_all_doctors()
             print("All doctors:")
         
         if not doctors:
@@ -155,47 +505,30 @@ class AppointmentController:
             self.wait_for_key()
             return -1
         
-        print(f"{'ID':<5}{'Name':<15}{'Email':<25}{'Specialisation':<20}")
-        print("-" * 65)
-        
-        for doctor in doctors:
-            specialisation = ", ".join(doctor.specialisation)
-            print(f"{doctor.id:<5}{doctor.full_name:<15}{doctor.email:<25}{specialisation:<20}")
-        
-        option_text = "\nSelect doctor ID"
-        if default_option:
-            option_text += ", or enter 0 to view all doctors/return"
-        else:
-            option_text += ", or enter 0 to return"
-        option_text += ", enter - to return to main menu"
-        option_text += ", press Enter to view all doctors by default: "
-        
-        print(option_text, end="")
-        choice = input()
-        
-        if choice == "":
-            return None  # Press Enter to view all doctors by default
-        
-        if choice == "-":
-            self.__should_return_to_main = True
-            return -1
-        
-        if choice == "0":
-            return -1 if not default_option else None
+        rows = [_DOCTOR_ROW_FMT.format(id=doctor.id, full_name=doctor.full_name, email=doctor.email,
+                                       specialisation=doctor.specialisation_str)
+                for doctor in doctors]
+        self._write_table(_DOCTOR_TABLE_HEAD, rows)
         
-        try:
-            doctor_id = int(choice)
-            selected_doctor = self.__appointment_service.get_doctor_by_id(doctor_id)
-            if selected_doctor:
+        # Invalid input only prints an error line and prompts again, the table stays on screen
+        while True:
+            choice = self._prompt(_DOCTOR_PROMPTS[default_option])
+            
+            action = self._nav_action(choice)
+            if action is NavAction.DEFAULT:
+                return None  # Press Enter to view all doctors by default
+            if action is NavAction.MAIN:
+                return -1
+            if action is NavAction.BACK:
+                return -1 if not default_option else None
+            
+            doctor_id = self._parse_int_choice(choice)
+            if doctor_id is None:
+                print("Please enter a valid number")
+            elif self._doctor(doctor_id):
                 return doctor_id
             else:
                 print("Invalid doctor ID")
-                self.wait_for_key()
-                return self.get_doctor_selection(clinic_id, default_option)
-        except ValueError:
-            print("Please enter a valid number")
-            self.wait_for_key()
-            return self.get_doctor_selection(clinic_id, default_option)
     
     def get_date_selection(self, future_only: bool = True, default_option: bool = True) -> Optional[str]:
         """Display date selection interface
@@ -208,146 +541,126 @@ class AppointmentController:
             Optional[str]: Selected date in YYYY-MM-DD format, returns None if any date selected
                           Returns empty string to go back, if self.__should_return_to_main is True then return to main menu
         """
-        self.print_header("Select Date")
-        
-        today = self.__appointment_service.get_current_date()
+        today_date = date.today()
+        today = today_date.isoformat()
 
         if future_only:
-            dates = self.__appointment_service.get_date_range(today, 7)
-            print("Future 7 days:")
+            dates_title = "Future 7 days:"
         else:
-            start_past = self.__DateUtil.shift_date(today, -7)
-            past_dates = self.__appointment_service.get_date_range(start_past, 7)
-            future_dates = self.__appointment_service.get_date_range(today, 7)
-            dates = past_dates + future_dates
-            print("Available dates (past 7 days and future 7 days):")
-        
-        print(f"{'Date':<15}{'Day of Week':<10}")
-        print("-" * 25)
-        
-        for date in dates:
-            day_of_week = self.__appointment_service.get_day_of_week(date)
-            print(f"{date:<15}{day_of_week:<10}")
-        
-        option_text = "\nEnter date (YYYY-MM-DD)"
-        if default_option:
-            option_text += ", or enter 0 to view all dates/return"
-        else:
-            option_text += ", or enter 0 to return"
-        option_text += ", enter - to return to main menu"
-        option_text += f", press Enter to select today ({today}): "
-        
-        print(option_text, end="")
-        choice = input()
+            dates_title = "Available dates (past 7 days and future 7 days):"
+        option_text = _DATE_PROMPTS[default_option].format(today=today)
         
-        if choice == "":
-            return today  # Press Enter to select today
-        
-        if choice == "-":
-            self.__should_return_to_main = True
-            return -1
-        
-        if choice == "0":
-            return -1 if not default_option else None
-        
-        if not self.__appointment_service.is_valid_date(choice):
-            print("Invalid date format, please use YYYY-MM-DD format")
-            self.wait_for_key()
-            return self.get_date_selection(future_only, default_option)
-        
-        if future_only and choice < today:
-            print("Please select a future date")
-            self.wait_for_key()
-            return self.get_date_selection(future_only, default_option)
+        self.print_header("Select Date")
+        print(dates_title)
+        self._write_table(_DATE_TABLE_HEAD, self._date_window(today_date, future_only))
         
-        return choice
+        # Invalid input only prints an error line and prompts again, the table stays on screen
+        while True:
+            choice = self._prompt(option_text)
+            
+            action = self._nav_action(choice)
+            if action is NavAction.DEFAULT:
+                return today  # Press Enter to select today
+            if action is NavAction.MAIN:
+                return -1
+            if action is NavAction.BACK:
+                return -1 if not default_option else None
+            
+            choice_date = DateUtil.parse_date(choice)
+            if choice_date is None:
+                print("Invalid date format, please use YYYY-MM-DD format")
+            elif future_only and choice_date < today_date:
+                print("Please select a future date")
+            else:
+                return choice
     
-    def show_available_slots(self, params: Dict[str, Any] = None) -> Optional[Tuple[str, int, int, int]]:
+    def show_available_slots(self, params: Dict[str, Any] = None) -> Optional[Tuple[str, int, Any, Any]]:
         """Display available time slot
         
         Args:
             params (Dict[str, Any], optional): Parameter dictionary, can include doctor_id, clinic_id, date
             
         Returns:
-            Optional[Tuple[str, int, int, int]]: (date, time slot, doctor ID, clinic ID) tuple
+            Optional[Tuple[str, int, Any, Any]]: (date, time slot, doctor, clinic) tuple
                                                 If user cancels then returns None
                                                 If self.__should_return_to_main is True then return to main menu
         """
         params = params or {}
         
-        # Get parameters
-        clinic_id = params.get('clinic_id')
-        doctor_id = params.get('doctor_id')
-        date = params.get('date')
-        
-        # If clinic is not specified, let user choose
-        if clinic_id is None:
-            clinic_id = self.get_clinic_selection()
-            if clinic_id == -1:  # User cancels or returns to main menu
-                return None
-        
-        # If doctor is not specified, let user choose
-        if doctor_id is None:
-            doctor_id = self.get_doctor_selection(clinic_id)
-            if doctor_id == -1:  # User cancels or returns to main menu
-                return None
-        
-        # If date is not specified, let user choose
-        if date is None:
-            date = self.get_date_selection()
-            if date == -1:  # User cancels or returns to main menu
-                return None
-        
-        # If no filtering conditions are specified, user must select at least one
-        if clinic_id is None and doctor_id is None and date is None:
-            print("Please select at least one filtering condition (clinic, doctor, or date)")
-            self.wait_for_key()
-            return self.show_available_slots()
+        while True:
+            # Get parameters
+            clinic_id = params.get('clinic_id')
+            doctor_id = params.get('doctor_id')
+            date = params.get('date')
+            
+            # If clinic is not specified, let user choose
+            if clinic_id is None:
+                clinic_id = self.get_clinic_selection()
+                if clinic_id == -1:  # User cancels or returns to main menu
+                    return None
+            
+            # If doctor is not specified, let user choose
+            if doctor_id is None:
+                doctor_id = self.get_doctor_selection(clinic_id)
+                if doctor_id == -1:  # User cancels or returns to main menu
+                    return None
+            
+            # If date is not specified, let user choose
+            if date is None:
+                date = self.get_date_selection()
+                if date == -1:  # User cancels or returns to main menu
+                    return None
+            
+            # If no filtering conditions are specified, user must select at least one
+            if clinic_id is None and doctor_id is None and date is None:
+                print("Please select at least one filtering condition (clinic, doctor, or date)")
+                self.wait_for_key()
+                params = {}
+                continue
+            break
         
         self.print_header("Available Time Slots")
         
         # Get available time slots
-        available_slots_data = self.__appointment_service.get_available_slots_data(clinic_id, doctor_id, date)
+        slot_keys, rows = self.__appointment_service.get_available_slots_data(clinic_id, doctor_id, date)
         
-        if not available_slots_data:
+        if not slot_keys:
             print("No available time slots found")
             self.wait_for_key()
             return None
         
         print("Available time slots:")
-        print(f"{'Date':<15}{'Day of Week':<10}{'Clinic':<15}{'Doctor':<15}{'Available Time'}")
-        print("-" * 85)
-        
-        option_index = 1
-        for date_str, slot, d_id, c_id, clinic_name, doctor_name, day_of_week, time_str in available_slots_data:
-            print(f"{option_index:2}. {date_str:<12} {day_of_week:<10} {clinic_name:<15} {doctor_name:<15} {time_str}")
-            option_index += 1
+        self._write_table(_SLOT_TABLE_HEAD, rows)
         
-        print("\nSelect time slot number, or enter 0 to return to previous menu, enter - to return to main menu, press Enter to select first: ", end="")
-        choice = input()
-        
-        if choice == "":
-            return available_slots_data[0][:4]  # Default select first available time slot (only return date, time slot, doctor ID, clinic ID)
-        
-        if choice == "-":
-            self.__should_return_to_main = True
-            return None
+        choice = self._prompt("\nSelect time slot number, or enter 0 to return to previous menu, enter - to return to main menu, press Enter to select first: ")
         
-        if choice == "0":
+        action = self._nav_action(choice)
+        if action is NavAction.DEFAULT:
+            return self._resolve_slot(slot_keys[0])  # Default select first available time slot
+        if action is not NavAction.VALUE:
             return None
         
-        try:
-            slot_index = int(choice) - 1
-            if 0 <= slot_index < len(available_slots_data):
-                return available_slots_data[slot_index][:4]  # Return selected time slot
-            else:
-                print("Invalid time slot number")
-                self.wait_for_key()
-                return None
-        except ValueError:
+        slot_number = self._parse_int_choice(choice)
+        if slot_number is None:
             print("Please enter a valid number")
-            self.wait_for_key()
-            return None
+        elif 0 < slot_number <= len(slot_keys):
+            return self._resolve_slot(slot_keys[slot_number - 1])  # Return selected time slot
+        else:
+            print("Invalid time slot number")
+        self.wait_for_key()
+        return None
+    
+    def _resolve_slot(self, slot_key: Tuple[str, int, int, int]) -> Tuple[str, int, Any, Any]:
+        """Resolve an available slot key to the objects needed for booking
+        
+        Args:
+            slot_key (Tuple[str, int, int, int]): Slot key returned by get_available_slots_data
+            
+        Returns:
+            Tuple[str, int, Any, Any]: (date, time slot, doctor, clinic) tuple
+        """
+        date_str, slot, doctor_id, clinic_id = slot_key
+        return date_str, slot, self._doctor(doctor_id), self._clinic(clinic_id)
     
     def make_appointment(self, user: User) -> None:
         """Appointment process
@@ -355,45 +668,40 @@ class AppointmentController:
         Args:
             user (User): Current user
         """
+        svc = self.__appointment_service
         # Select available time slot
         slot_info = self.show_available_slots()
         if not slot_info:
             return
         
-        date, time_slot, doctor_id, clinic_id = slot_info
-        
-        doctor = self.__appointment_service.get_doctor_by_id(doctor_id)
-        clinic = self.__appointment_service.get_clinic_by_id(clinic_id)
+        date, time_slot, doctor, clinic = slot_info
         
         # Input appointment reason
         self.print_header("Appointment Information")
         print(f"Clinic: {clinic.name}")
         print(f"Doctor: {doctor.full_name}")
         print(f"Date: {date}")
-        print(f"Time: {self.__appointment_service.get_time_slot_str(time_slot)}")
+        print(f"Time: {svc.get_time_slot_str(time_slot)}")
         
-        reason = input("\nEnter appointment reason (Press Enter for default 'Regular Appointment'): ")
+        reason = self._prompt("\nEnter appointment reason (Press Enter for default 'Regular Appointment'): ")
         if reason == "":
             reason = "Regular Appointment"  # Default appointment reason
         
         # Confirm appointment
-        print("\nConfirm appointment information (Y/N), or enter 0 to return to previous menu, enter - to return to main menu, press Enter for default Y: ", end="")
-        confirm = input().strip().upper()
+        confirm = self._prompt("\nConfirm appointment information (Y/N), or enter 0 to return to previous menu, enter - to return to main menu, press Enter for default Y: ").strip().upper()
         
-        if confirm == "-":
-            self.__should_return_to_main = True
-            return
-            
-        if confirm == "0":
+        action = self._nav_action(confirm, _CONFIRM_NAV)
+        if action in (NavAction.MAIN, NavAction.BACK):
             return
             
-        if confirm == "" or confirm == "Y":
+        if action in (NavAction.DEFAULT, NavAction.YES):
             try:
                 # Create appointment
-                appointment = self.__appointment_service.make_appointment(
-                    user.id, doctor_id, clinic_id, date, time_slot, reason
+                appointment = svc.make_appointment(
+                    user.id, doctor.id, clinic.id, date, time_slot, reason
                 )
                 
+                self._invalidate_caches()
                 print("\nAppointment successful!")
                 print(f"Appointment ID: {appointment.id}")
             except ValueError as e:
@@ -411,6 +719,7 @@ class AppointmentController:
             future_only (bool): Whether to only show future appointments
             history_only (bool): Whether to only show history appointments
         """
+        svc = self.__appointment_service
         title = "My Appointments"
         if future_only:
             title = "Upcoming Appointments"
@@ -420,41 +729,50 @@ class AppointmentController:
         self.print_header(title)
         
         # Get appointment list
-        appointments = self.__appointment_service.get_user_appointments(user.id, future_only, history_only)
+        appointments = svc.get_user_appointments(user.id, future_only, history_only)
         
         if not appointments:
             print("You have no appointment records" if not future_only and not history_only else "No appointments found that meet the criteria")
             self.wait_for_key()
             return
         
-        print(f"{'ID':<5}{'Date':<15}{'Time':<20}{'Clinic':<15}{'Doctor':<15}{'Status':<15}")
-        print("-" * 85)
+        rows = [_MY_APPOINTMENT_ROW_FMT.format_map(appointment) for appointment in appointments]
+        self._write_table(_MY_APPOINTMENT_TABLE_HEAD, rows)
         
-        for appointment in appointments:
-            print(f"{appointment['id']:<5}{appointment['date']:<15}{appointment['time_str']:<20}{appointment['clinic_name']:<15}{appointment['doctor_name']:<15}{appointment['status']:<15}")
-        
-        print("\nSelect appointment ID to view details, or enter 0 to return to previous menu, enter - to return to main menu, press Enter for default return: ", end="")
-        choice = input()
+        choice = self._prompt("\nSelect appointment ID to view details, or enter 0 to return to previous menu, enter - to return to main menu, press Enter for default return: ")
         
-        if choice == "-":
-            self.__should_return_to_main = True
-            return
-            
-        if choice == "" or choice == "0":
+        if self._nav_action(choice) is not NavAction.VALUE:
             return
         
-        try:
-            appointment_id = int(choice)
-            appointment_details = self.__appointment_service.get_appointment_details(appointment_id)
-            
-            if appointment_details and appointment_details['user_id'] == user.id:
-                self.show_appointment_details(appointment_details)
-            else:
-                print("Invalid appointment ID or you do not have permission to view this appointment")
-                self.wait_for_key()
-        except ValueError:
+        appointment_id = self._parse_int_choice(choice)
+        if appointment_id is None:
             print("Please enter a valid number")
             self.wait_for_key()
+            return
+        
+        appointment_details = self._listed_details(appointments, appointment_id)
+        
+        if appointment_details and appointment_details['user_id'] == user.id:
+            self.show_appointment_details(appointment_details)
+        else:
+            print("Invalid appointment ID or you do not have permission to view this appointment")
+            self.wait_for_key()
+    
+    def _listed_details(self, appointments: List[Dict], appointment_id: int) -> Optional[Dict]:
+        """Get details for an appointment, reusing the listed appointment object when it was shown
+        
+        Args:
+            appointments (List[Dict]): Appointment rows on screen
+            appointment_id (int): Appointment ID
+            
+        Returns:
+            Optional[Dict]: Appointment details dictionary, None if not found
+        """
+        svc = self.__appointment_service
+        for appointment in appointments:
+            if appointment['id'] == appointment_id:
+                return svc.build_appointment_details(appointment['appointment_obj'])
+        return svc.get_appointment_details(appointment_id)
     
     def show_appointment_details(self, appointment_details: Dict) -> None:
         """Display appointment details
@@ -464,42 +782,24 @@ class AppointmentController:
         """
         self.print_header("Appointment Details")
         
-        print(f"Appointment ID: {appointment_details['id']}")
-        print(f"User ID: {appointment_details['user_id']}")
-        print(f"Patient Name: {appointment_details['user_name']}")
-        print(f"Patient Email: {appointment_details['user_email']}")
-        print(f"Date: {appointment_details['date']}")
-        print(f"Time: {appointment_details['time_str']}")
-        print(f"Clinic: {appointment_details['clinic_name']}")
-        print(f"Clinic Address: {appointment_details['clinic_address']}")
-        print(f"Doctor: {appointment_details['doctor_name']}")
-        print(f"Appointment Reason: {appointment_details['reason']}")
-        print(f"Status: {appointment_details['status']}")
+        sys.stdout.write(_DETAILS_FMT.format_map(appointment_details))
         
         # Only cancellable appointments can be cancelled
         if appointment_details['can_cancel']:
-            print("\n1. Cancel Appointment")
-            print("0. Return to previous menu")
-            print("-. Return to main menu")
+            sys.stdout.write(_CANCELLABLE_DETAILS_MENU)
             
-            choice = input("\nSelect operation, press Enter for default return: ")
+            choice = self._prompt("\nSelect operation, press Enter for default return: ")
             
-            if choice == "-":
-                self.__should_return_to_main = True
-                return
-                
-            if choice == "" or choice == "0":
+            if self._nav_action(choice) is not NavAction.VALUE:
                 return
             
             if choice == "1":
                 self.cancel_appointment(appointment_details['appointment_obj'])
         else:
-            print("\n0. Return to previous menu")
-            print("-. Return to main menu")
-            choice = input("\nSelect operation, press Enter for default return: ")
+            sys.stdout.write(_DETAILS_MENU)
+            choice = self._prompt("\nSelect operation, press Enter for default return: ")
             
-            if choice == "-":
-                self.__should_return_to_main = True
+            if self._nav_action(choice) is NavAction.MAIN:
                 return
                 
             self.wait_for_key()
@@ -510,25 +810,20 @@ class AppointmentController:
         Args:
             appointment: Appointment object
         """
-        print("\nConfirm cancellation (Y/N), or enter 0 to return to previous menu, enter - to return to main menu, press Enter for default N: ", end="")
-        confirm = input().strip().upper()
+        confirm = self._prompt("\nConfirm cancellation (Y/N), or enter 0 to return to previous menu, enter - to return to main menu, press Enter for default N: ").strip().upper()
         
-        if confirm == "-":
-            self.__should_return_to_main = True
-            return
-            
-        if confirm == "0" or confirm == "":
-            print("Operation cancelled")
-            self.wait_for_key()
+        action = self._nav_action(confirm, _CONFIRM_NAV)
+        if action is NavAction.MAIN:
             return
         
-        if confirm != "Y":
+        if action is not NavAction.YES:
             print("Operation cancelled")
             self.wait_for_key()
             return
         
         # Cancel appointment
         if self.__appointment_service.cancel_appointment(appointment):
+            self._invalidate_caches()
             print("\nAppointment cancelled successfully")
         else:
             print("\nAppointment cancellation failed, possibly appointment has already been cancelled")
@@ -537,201 +832,166 @@ class AppointmentController:
 
     def _show_all_appointments(self) -> None:
         """Display all system appointments (Admin only)"""
+        svc = self.__appointment_service
         self.print_header("All Appointments")
-        appointments = self.__appointment_service.get_all_appointments()
+        appointments = svc.get_all_appointments()
 
         if not appointments:
             print("No appointments found")
             self.wait_for_key()
             return
 
-        print(f"{'ID':<5}{'User ID':<8}{'Date':<12}{'Time':<18}{'Doctor':<15}{'Clinic':<15}{'Status':<12}")
-        print("-" * 90)
-        for appt in appointments:
-            print(f"{appt['id']:<5}{appt['user_id']:<8}{appt['date']:<12}{appt['time_str']:<18}"
-                  f"{appt['doctor_name']:<15}{appt['clinic_name']:<15}{appt['status']:<12}")
+        rows = [_ALL_APPOINTMENT_ROW_FMT.format_map(appt) for appt in appointments]
+        self._write_table(_ALL_APPOINTMENT_TABLE_HEAD, rows)
         
-        print("\nSelect appointment ID to view details, or press 0 to return: ", end="")
-        choice = input().strip()
+        choice = self._prompt("\nSelect appointment ID to view details, or press 0 to return: ").strip()
         
-        if choice == "0" or choice == "":
+        if self._nav_action(choice) is not NavAction.VALUE:
             return
             
-        try:
-            appt_id = int(choice)
-            appt_details = self.__appointment_service.get_appointment_details(appt_id)
-            if appt_details:
-                self.show_appointment_details(appt_details)
-                
-                # Provide cancellation option
-                if appt_details.get('status') == "Appointed":
-                    if input("\nCancel this appointment? (Y/N): ").strip().upper() == "Y":
-                        appointment = self.__appointment_service.get_appointment_by_id(appt_id)
-                        if appointment:
-                            if self.__appointment_service.cancel_appointment(appointment):
-                                print("Appointment cancelled successfully")
-                            else:
-                                print("Appointment cancellation failed")
-                        else:
-                            print("Cannot retrieve appointment information")
-            else:
-                print("Invalid appointment ID")
-        except ValueError:
+        appt_id = self._parse_int_choice(choice)
+        if appt_id is None:
             print("Please enter a valid number")
+            self.wait_for_key()
+            return
+        
+        appt_details = self._listed_details(appointments, appt_id)
+        if appt_details:
+            self.show_appointment_details(appt_details)
+            
+            # Provide cancellation option
+            if appt_details.get('status') == "Appointed":
+                if self._prompt("\nCancel this appointment? (Y/N): ").strip().upper() == "Y":
+                    appointment = appt_details.get('appointment_obj')
+                    if appointment:
+                        if svc.cancel_appointment(appointment):
+                            print("Appointment cancelled successfully")
+                        else:
+                            print("Appointment cancellation failed")
+                    else:
+                        print("Cannot retrieve appointment information")
+        else:
+            print("Invalid appointment ID")
             
         self.wait_for_key()
 
     def _cancel_by_id(self) -> None:
         """Admin manually cancel any appointment"""
+        svc = self.__appointment_service
         self.print_header("Cancel Appointment by ID")
         
-        try:
-            appt_id = int(input("\nEnter appointment ID to cancel (0 to return): ").strip())
-            if appt_id == 0:
-                return
-                
-            appointment = self.__appointment_service.get_appointment_by_id(appt_id)
-            if not appointment:
-                print("Appointment does not exist")
-                self.wait_for_key()
-                return
-                
-            # Get detailed information and display
-            appt_details = self.__appointment_service.get_appointment_details(appt_id)
-            if appt_details:
-                print("\nAppointment Details:")
-                print(f"ID: {appt_details['id']}")
-                print(f"User ID: {appt_details['user_id']}")
-                print(f"Patient Name: {appt_details.get('user_name', 'Unknown')}")
-                print(f"Date: {appt_details['date']}")
-                print(f"Time: {appt_details['time_str']}")
-                print(f"Clinic: {appt_details['clinic_name']}")
-                print(f"Doctor: {appt_details['doctor_name']}")
-                print(f"Current Status: {appt_details['status']}")
-            
-            if not appointment.is_scheduled():
-                print("\nThis appointment status cannot be cancelled (possibly already cancelled or completed)")
-                self.wait_for_key()
-                return
-                
-            if input("\nConfirm cancellation of this appointment? (Y/N): ").strip().upper() == "Y":
-                if self.__appointment_service.cancel_appointment(appointment):
-                    print("Appointment cancelled successfully")
-                else:
-                    print("Cancellation failed")
-            else:
-                print("Operation cancelled")
-        except ValueError:
+        appt_id = self._parse_int_choice(self._prompt("\nEnter appointment ID to cancel (0 to return): "))
+        if appt_id is None:
             print("Please enter a valid number")
+            self.wait_for_key()
+            return
+        if appt_id == 0:
+            return
+            
+        # Details carry the appointment object, so one lookup serves both display and cancellation
+        appt_details = svc.get_appointment_details(appt_id)
+        if not appt_details:
+            print("Appointment does not exist")
+            self.wait_for_key()
+            return
+        appointment = appt_details['appointment_obj']
+            
+        sys.stdout.write(_CANCEL_DETAILS_FMT.format_map(appt_details))
+        
+        if not appointment.is_scheduled():
+            print("\nThis appointment status cannot be cancelled (possibly already cancelled or completed)")
+            self.wait_for_key()
+            return
+            
+        if self._prompt("\nConfirm cancellation of this appointment? (Y/N): ").strip().upper() == "Y":
+            if svc.cancel_appointment(appointment):
+                print("Appointment cancelled successfully")
+            else:
+                print("Cancellation failed")
+        else:
+            print("Operation cancelled")
         self.wait_for_key()
 
     def _search_as_admin(self) -> None:
         """Admin filter appointments (no user_id restriction)"""
-        dummy_user = User(id=-1)  # Used to bypass user_id restriction
-        self.search_appointments(dummy_user)
+        self.search_appointments(self.__current_user, admin=True)
 
-    def search_appointments(self, user: User) -> None:
+    def search_appointments(self, user: Optional[User], admin: bool = False) -> None:
         """Search appointments
         
         Args:
-            user (User): Current user
+            user (Optional[User]): Current user, may be None for admin
+            admin (bool): Whether to search all users' appointments
         """
         self.print_header("Search Appointments")
         
-        print("Select filtering condition:")
-        print("1. Filter by clinic")
-        print("2. Filter by doctor")
-        print("3. Filter by date")
-        print("4. Filter by clinic and doctor")
-        print("5. Filter by clinic and date")
-        print("6. Filter by doctor and date")
-        print("7. Filter by clinic, doctor, and date")
-        print("0. Return to previous menu")
-        print("-. Return to main menu")
+        sys.stdout.write(_SEARCH_MENU)
         
-        choice = input("\nSelect: ")
+        choice = self._prompt("\nSelect: ")
         
-        if choice == "-":
-            self.__should_return_to_main = True
-            return
-            
-        if choice == "0":
+        action = self._nav_action(choice)
+        if action in (NavAction.MAIN, NavAction.BACK):
             return
         
         params = {}
-        
-        if choice in ["1", "4", "5", "7"]:
-            clinic_id = self.get_clinic_selection()
-            if clinic_id == -1:
-                if self.__should_return_to_main:
-                    return
-                return
-            params['clinic_id'] = clinic_id
-        
-        if choice in ["2", "4", "6", "7"]:
-            doctor_id = self.get_doctor_selection(params.get('clinic_id'))
-            if doctor_id == -1:
-                if self.__should_return_to_main:
-                    return
-                return
-            params['doctor_id'] = doctor_id
-        
-        if choice in ["3", "5", "6", "7"]:
-            date = self.get_date_selection(future_only=False)
-            if date == -1:
-                if self.__should_return_to_main:
+        mask = _SEARCH_MASKS.get(choice, 0)
+        
+        # Selector for each filter flag, run in this order so the doctor list can use the chosen clinic
+        selectors = (
+            (_SEARCH_BY_CLINIC, 'clinic_id', lambda: self.get_clinic_selection()),
+            (_SEARCH_BY_DOCTOR, 'doctor_id', lambda: self.get_doctor_selection(params.get('clinic_id'))),
+            (_SEARCH_BY_DATE, 'date', lambda: self.get_date_selection(future_only=False)),
+        )
+        for flag, key, select in selectors:
+            if mask & flag:
+                value = select()
+                if value == -1:  # User cancels or returns to main menu
                     return
-                return
-            params['date'] = date
+                params[key] = value
         
-        self.show_filtered_appointments(user, params)
+        self.show_filtered_appointments(user, params, admin)
     
-    def show_filtered_appointments(self, user: User, params: Dict[str, Any]) -> None:
+    def show_filtered_appointments(self, user: Optional[User], params: Dict[str, Any], admin: bool = False) -> None:
         """Display filtered appointment list
         
         Args:
-            user (User): Current user
+            user (Optional[User]): Current user, may be None for admin
             params (Dict[str, Any]): Filter parameters
+            admin (bool): Whether to list and open all users' appointments
         """
+        svc = self.__appointment_service
         self.print_header("Filtered Results")
         
         # Get filtered appointments
-        appointments = self.__appointment_service.filter_appointments(user.id, params)
+        appointments = svc.filter_appointments(None if admin else user.id, params)
         
         if not appointments:
             print("No appointments found that meet the criteria")
             self.wait_for_key()
             return
         
-        print(f"{'ID':<5}{'User ID':<8}{'Date':<15}{'Time':<20}{'Clinic':<15}{'Doctor':<15}{'Status':<15}")
-        print("-" * 95)
-        
-        for appointment in appointments:
-            print(f"{appointment['id']:<5}{appointment['user_id']:<8}{appointment['date']:<15}{appointment['time_str']:<20}{appointment['clinic_name']:<15}{appointment['doctor_name']:<15}{appointment['status']:<15}")
+        rows = [_FILTERED_APPOINTMENT_ROW_FMT.format_map(appointment) for appointment in appointments]
+        self._write_table(_FILTERED_APPOINTMENT_TABLE_HEAD, rows)
         
-        print("\nSelect appointment ID to view details, or enter 0 to return to previous menu, enter - to return to main menu, press Enter for default return: ", end="")
-        choice = input()
+        choice = self._prompt("\nSelect appointment ID to view details, or enter 0 to return to previous menu, enter - to return to main menu, press Enter for default return: ")
         
-        if choice == "-":
-            self.__should_return_to_main = True
-            return
-            
-        if choice == "" or choice == "0":
+        if self._nav_action(choice) is not NavAction.VALUE:
             return
         
-        try:
-            appointment_id = int(choice)
-            appointment_details = self.__appointment_service.get_appointment_details(appointment_id)
-            
-            # Allow admin (user.id is -1) to view all appointment details
-            if appointment_details and (appointment_details['user_id'] == user.id or user.id == -1):
-                self.show_appointment_details(appointment_details)
-            else:
-                print("Invalid appointment ID or you do not have permission to view this appointment")
-                self.wait_for_key()
-        except ValueError:
+        appointment_id = self._parse_int_choice(choice)
+        if appointment_id is None:
             print("Please enter a valid number")
             self.wait_for_key()
+            return
+        
+        appointment_details = self._listed_details(appointments, appointment_id)
+        
+        # Admin can view all appointment details
+        if appointment_details and (admin or appointment_details['user_id'] == user.id):
+            self.show_appointment_details(appointment_details)
+        else:
+            print("Invalid appointment ID or you do not have permission to view this appointment")
+            self.wait_for_key()
 
     def run_appointment_menu(self, user: User) -> None:
         """Run appointment menu
@@ -740,6 +1000,7 @@ class AppointmentController:
             user (User): Current user
         """
         self.__should_return_to_main = False  # Reset return to main menu flag
+        self._invalidate_caches()  # Start each menu session from current clinic/doctor data
         
         while True:
             if self.__should_return_to_main:
@@ -747,30 +1008,14 @@ class AppointmentController:
                 
             self.print_header(f"Appointment Menu - {user.name}")
             
-            print("1. Query available time slot and book")
-            print("2. View all my appointments")
-            print("3. View upcoming appointments")
-            print("4. View history appointments")
-            print("5. Search appointments")
-            print("0. Return to previous menu")
-            print("-. Return to main menu")
+            sys.stdout.write(_APPOINTMENT_MENU)
             
-            choice = input("\nSelect operation: ")
+            choice = self._prompt("\nSelect operation: ")
             
-            if choice == "1":
-                self.make_appointment(user)
-            elif choice == "2":
-                self.show_appointments(user)
-            elif choice == "3":
-                self.show_appointments(user, future_only=True)
-            elif choice == "4":
-                self.show_appointments(user, history_only=True)
-            elif choice == "5":
-                self.search_appointments(user)
-            elif choice == "0":
-                break
-            elif choice == "-":
-                self.__should_return_to_main = True
+            action = self._MENU_ACTIONS.get(choice)
+            if action:
+                action(self, user)
+            elif self._nav_action(choice) in (NavAction.MAIN, NavAction.BACK):
                 break
             else:
                 print("Invalid selection")
@@ -779,29 +1024,20 @@ class AppointmentController:
     def run_admin_menu(self) -> None:
         """Admin appointment management menu"""
         self.__should_return_to_main = False  # Reset return to main menu flag
+        self._invalidate_caches()  # Start each menu session from current clinic/doctor data
         
         while True:
             if self.__should_return_to_main:
                 break
                 
             self.print_header("Appointment Management - Admin")
-            print("1. View all appointments")
-            print("2. Filter appointments by condition")
-            print("3. Cancel appointment by ID")
-            print("0. Return to previous menu")
-            print("-. Return to main menu")
-            choice = input("\nSelect operation: ").strip()
+            sys.stdout.write(_ADMIN_MENU)
+            choice = self._prompt("\nSelect operation: ").strip()
 
-            if choice == "1":
-                self._show_all_appointments()
-            elif choice == "2":
-                self._search_as_admin()
-            elif choice == "3":
-                self._cancel_by_id()
-            elif choice == "0":
-                break
-            elif choice == "-":
-                self.__should_return_to_main = True
+            action = self._ADMIN_ACTIONS.get(choice)
+            if action:
+                action(self)
+            elif self._nav_action(choice) in (NavAction.MAIN, NavAction.BACK):
                 break
             else:
                 print("Invalid option")
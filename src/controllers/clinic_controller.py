@@ -5,18 +5,64 @@
 Clinic and Doctor Management Controller - Handles clinic and doctor management functions
 """
 
-import os
-from typing import Optional, Dict, Any, List
+import re
+import sys
+from typing import Optional, Dict, Any, List, Iterable, Callable
 
 from src.entities.user import User
 from src.entities.clinic import Clinic
 from src.entities.doctor import Doctor
 from src.repositories.clinic_repository import ClinicRepository
 from src.repositories.doctor_repository import DoctorRepository
+from src.utils.screen_util import ScreenUtil
+
+# Table row layouts, parsed once at import rather than on every row
+_CLINIC_ROW_FMT = "{id:<5}{name:<15}{suburb:<10}{address:<25}{phone:<15}"
+_CLINIC_HEADER = _CLINIC_ROW_FMT.format(id="ID", name="Name", suburb="Suburb", address="Address", phone="Phone")
+
+_DOCTOR_ROW_FMT = "{id:<5}{full_name:<15}{email:<25}{specialisation:<25}"
+_DOCTOR_HEADER = _DOCTOR_ROW_FMT.format(id="ID", full_name="Name", email="Email", specialisation="Specialisation")
+
+_CLINIC_TABLE_HEAD = f"{_CLINIC_HEADER}\n{'-' * 70}\n"
+_DOCTOR_TABLE_HEAD = f"{_DOCTOR_HEADER}\n{'-' * 70}\n"
+
+
+def _clinic_row(clinic: Clinic) -> str:
+    """Format a clinic as a table row"""
+    return _CLINIC_ROW_FMT.format(id=clinic.id, name=clinic.name, suburb=clinic.suburb,
+                                  address=clinic.address, phone=clinic.phone)
+
+
+def _clinic_item(clinic: Clinic) -> str:
+    """Format a clinic as a line of the association screens' clinic lists"""
+    return f"ID: {clinic.id}, Name: {clinic.name}, Suburb: {clinic.suburb}"
+
+
+def _doctor_row(doctor: Doctor) -> str:
+    """Format a doctor as a table row"""
+    return _DOCTOR_ROW_FMT.format(id=doctor.id, full_name=doctor.full_name, email=doctor.email,
+                                  specialisation=doctor.specialisation_str)
+
+
+# Semicolon with surrounding whitespace, for splitting specialisation lists
+_SPEC_SEP_RE = re.compile(r"\s*;\s*")
+
 
 class ClinicController:
     """Clinic and Doctor Management Controller"""
     
+    # Edit menu option -> (property to set, label used in the prompt)
+    _CLINIC_EDIT_FIELDS = {
+        "1": ("name", "name"),
+        "2": ("suburb", "suburb"),
+        "3": ("address", "address"),
+        "4": ("phone", "phone"),
+    }
+    _DOCTOR_EDIT_FIELDS = {
+        "1": ("full_name", "name"),
+        "2": ("email", "email"),
+    }
+    
     def __init__(self, user=None):
         """Initialize clinic and doctor management controller
         
@@ -27,10 +73,54 @@ class ClinicController:
         self.__doctor_repo = DoctorRepository()
         self.__current_user = user
         self.__should_return_to_main = False  # Flag to return to main menu
+        # Entities loaded for display, reused until the repository's version changes
+        self.__clinic_cache = None
+        self.__clinic_by_id = None
+        self.__clinic_version = None
+        self.__doctor_cache = None
+        self.__doctor_version = None
+    
+    def _clinics(self) -> List[Clinic]:
+        """Get all clinics, loaded once and reused until the clinic data changes
+        
+        The clinics are shared between calls, screens that edit a clinic load their own copy.
+        
+        Returns:
+            List[Clinic]: List of clinics
+        """
+        version = self.__clinic_repo.version
+        if self.__clinic_cache is None or version != self.__clinic_version:
+            self.__clinic_cache = self.__clinic_repo.get_all()
+            self.__clinic_by_id = {clinic.id: clinic for clinic in self.__clinic_cache}
+            self.__clinic_version = version
+        return self.__clinic_cache
+    
+    def _clinic_map(self) -> Dict[int, Clinic]:
+        """Get all clinics by ID, shared with _clinics
+        
+        Returns:
+            Dict[int, Clinic]: Clinic ID to clinic
+        """
+        self._clinics()
+        return self.__clinic_by_id
+    
+    def _doctors(self) -> List[Doctor]:
+        """Get all doctors, loaded once and reused until the doctor data changes
+        
+        The doctors are shared between calls, screens that edit a doctor load their own copy.
+        
+        Returns:
+            List[Doctor]: List of doctors
+        """
+        version = self.__doctor_repo.version
+        if self.__doctor_cache is None or version != self.__doctor_version:
+            self.__doctor_cache = self.__doctor_repo.get_all()
+            self.__doctor_version = version
+        return self.__doctor_cache
     
     def clear_screen(self):
         """Clear screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        ScreenUtil.clear_screen()
     
     def print_header(self, title):
         """Print title header
@@ -47,23 +137,37 @@ class ClinicController:
         """Wait for user to press a key"""
         input("\nPress Enter to continue...")
     
+    def _render_table(self, head: str, entities: List, format_row: Callable[[Any], str]) -> None:
+        """Write a table, header, rule and rows going out in one write
+        
+        Args:
+            head (str): Precomputed header and separator lines, newline terminated
+            entities (List): Entities to list
+            format_row (Callable[[Any], str]): Formats one entity as a row
+        """
+        sys.stdout.write(head + "".join(format_row(entity) + "\n" for entity in entities))
+    
+    def _write_lines(self, lines: Iterable[str]) -> None:
+        """Write lines with a single write
+        
+        Args:
+            lines (Iterable[str]): Lines without trailing newlines
+        """
+        sys.stdout.write("".join(line + "\n" for line in lines))
+    
     # ================ Clinic Management Functions ================
     def show_all_clinics(self) -> None:
         """Display all clinics"""
         self.print_header("All Clinics")
         
-        clinics = self.__clinic_repo.get_all()
+        clinics = self._clinics()
         
         if not clinics:
             print("No clinic records in the system")
             self.wait_for_key()
             return
         
-        print(f"{'ID':<5}{'Name':<15}{'Suburb':<10}{'Address':<25}{'Phone':<15}")
-        print("-" * 70)
-        
-        for clinic in clinics:
-            print(f"{clinic.id:<5}{clinic.name:<15}{clinic.suburb:<10}{clinic.address:<25}{clinic.phone:<15}")
+        self._render_table(_CLINIC_TABLE_HEAD, clinics, _clinic_row)
         
         print("\nSelect an option:")
         print("1. Add New Clinic")
@@ -147,44 +251,40 @@ class ClinicController:
                 self.wait_for_key()
                 return
                 
-            print(f"\nCurrent clinic information:")
-            print(f"ID: {clinic.id}")
-            print(f"Name: {clinic.name}")
-            print(f"Suburb: {clinic.suburb}")
-            print(f"Address: {clinic.address}")
-            print(f"Phone: {clinic.phone}")
-            
-            print("\nSelect field to edit:")
-            print("1. Name")
-            print("2. Suburb")
-            print("3. Address")
-            print("4. Phone")
-            print("0. Return")
-            
-            field = input("\nSelect: ").strip()
-            
-            if field == "0":
-                return
+            # Several fields can be changed in one visit, the clinic is saved once on leaving
+            changed = False
+            while True:
+                print(f"\nCurrent clinic information:")
+                print(f"ID: {clinic.id}")
+                print(f"Name: {clinic.name}")
+                print(f"Suburb: {clinic.suburb}")
+                print(f"Address: {clinic.address}")
+                print(f"Phone: {clinic.phone}")
                 
-            if field == "1":
-                new_name = input(f"New name (current: {clinic.name}): ").strip()
-                if new_name:
-                    clinic.name = new_name
-            elif field == "2":
-                new_suburb = input(f"New suburb (current: {clinic.suburb}): ").strip()
-                if new_suburb:
-                    clinic.suburb = new_suburb
-            elif field == "3":
-                new_address = input(f"New address (current: {clinic.address}): ").strip()
-                if new_address:
-                    clinic.address = new_address
-            elif field == "4":
-                new_phone = input(f"New phone (current: {clinic.phone}): ").strip()
-                if new_phone:
-                    clinic.phone = new_phone
-            else:
-                print("Invalid option")
-                self.wait_for_key()
+                print("\nSelect field to edit:")
+                print("1. Name")
+                print("2. Suburb")
+                print("3. Address")
+                print("4. Phone")
+                print("0. Save and Return" if changed else "0. Return")
+                
+                field = input("\nSelect: ").strip()
+                
+                if field == "0":
+                    break
+                    
+                edit_field = self._CLINIC_EDIT_FIELDS.get(field)
+                if edit_field is None:
+                    print("Invalid option")
+                    continue
+                
+                attr, label = edit_field
+                new_value = input(f"New {label} (current: {getattr(clinic, attr)}): ").strip()
+                if new_value:
+                    setattr(clinic, attr, new_value)
+                    changed = True
+            
+            if not changed:
                 return
             
             # Update clinic
@@ -218,7 +318,7 @@ class ClinicController:
                 return
                 
             # Check if there are doctors associated with this clinic
-            doctors = self.__doctor_repo.get_by_clinic(clinic_id)
+            doctors = [doctor for doctor in self._doctors() if doctor.is_working_in_clinic(clinic_id)]
             if doctors:
                 print(f"Cannot delete clinic, there are {len(doctors)} doctors associated with it")
                 print("Please remove these doctors from the clinic first")
@@ -264,11 +364,7 @@ class ClinicController:
             return
         
         print(f"\nFound {len(clinics)} matching clinics:")
-        print(f"{'ID':<5}{'Name':<15}{'Suburb':<10}{'Address':<25}{'Phone':<15}")
-        print("-" * 70)
-        
-        for clinic in clinics:
-            print(f"{clinic.id:<5}{clinic.name:<15}{clinic.suburb:<10}{clinic.address:<25}{clinic.phone:<15}")
+        self._render_table(_CLINIC_TABLE_HEAD, clinics, _clinic_row)
         
         self.wait_for_key()
     
@@ -277,19 +373,14 @@ class ClinicController:
         """Display all doctors"""
         self.print_header("All Doctors")
         
-        doctors = self.__doctor_repo.get_all()
+        doctors = self._doctors()
         
         if not doctors:
             print("No doctor records in the system")
             self.wait_for_key()
             return
         
-        print(f"{'ID':<5}{'Name':<15}{'Email':<25}{'Specialisation':<25}")
-        print("-" * 70)
-        
-        for doctor in doctors:
-            specialisations = ", ".join(doctor.specialisation)
-            print(f"{doctor.id:<5}{doctor.full_name:<15}{doctor.email:<25}{specialisations:<25}")
+        self._render_table(_DOCTOR_TABLE_HEAD, doctors, _doctor_row)
         
         print("\nSelect an option:")
         print("1. Add New Doctor")
@@ -345,7 +436,7 @@ class ClinicController:
         
         # Specialisation - Changed to input in one line, separated by semicolon
         spec_input = input("Specialisation (use semicolon ';' to separate multiple specialisations): ").strip()
-        specialisations = [spec.strip() for spec in spec_input.split(';') if spec.strip()]
+        specialisations = [spec for spec in _SPEC_SEP_RE.split(spec_input) if spec]
         
         # Create new doctor
         new_doctor = Doctor(
@@ -381,137 +472,156 @@ class ClinicController:
                 self.wait_for_key()
                 return
                 
-            print(f"\nCurrent doctor information:")
-            print(f"ID: {doctor.id}")
-            print(f"Name: {doctor.full_name}")
-            print(f"Email: {doctor.email}")
-            print(f"Specialisation: {', '.join(doctor.specialisation)}")
-            
-            print("\nSelect field to edit:")
-            print("1. Name")
-            print("2. Email")
-            print("3. Manage Specialisation")
-            print("0. Return")
-            
-            field = input("\nSelect: ").strip()
-            
-            if field == "0":
-                return
-                
-            if field == "1":
-                new_name = input(f"New name (current: {doctor.full_name}): ").strip()
-                if new_name:
-                    doctor.full_name = new_name
-            elif field == "2":
-                new_email = input(f"New email (current: {doctor.email}): ").strip()
-                if new_email:
-                    doctor.email = new_email
-            elif field == "3":
-                self.manage_doctor_specialisations(doctor)
-                return
-            else:
-                print("Invalid option")
-                self.wait_for_key()
-                return
-            
-            # Update doctor
+            # Several fields can be changed in one visit; the doctor, including changes made on
+            # the specialisation screen, is written once on leaving
+            changed = False
             try:
-                self.__doctor_repo.update(doctor)
-                print("\nDoctor information updated")
+                with self.__doctor_repo.batch():
+                    while True:
+                        print(f"\nCurrent doctor information:")
+                        print(f"ID: {doctor.id}")
+                        print(f"Name: {doctor.full_name}")
+                        print(f"Email: {doctor.email}")
+                        print(f"Specialisation: {doctor.specialisation_str}")
+                        
+                        print("\nSelect field to edit:")
+                        print("1. Name")
+                        print("2. Email")
+                        print("3. Manage Specialisation")
+                        print("0. Save and Return" if changed else "0. Return")
+                        
+                        field = input("\nSelect: ").strip()
+                        
+                        if field == "0":
+                            break
+                            
+                        if field == "3":
+                            if self.manage_doctor_specialisations(doctor):
+                                changed = True
+                            self.print_header("Edit Doctor")
+                            continue
+                        
+                        edit_field = self._DOCTOR_EDIT_FIELDS.get(field)
+                        if edit_field is None:
+                            print("Invalid option")
+                            continue
+                        
+                        attr, label = edit_field
+                        new_value = input(f"New {label} (current: {getattr(doctor, attr)}): ").strip()
+                        if new_value:
+                            setattr(doctor, attr, new_value)
+                            changed = True
+                    
+                    if changed:
+                        self.__doctor_repo.update(doctor)
             except Exception as e:
                 print(f"Failed to update doctor: {str(e)}")
+                self.wait_for_key()
+                return
+            
+            if not changed:
+                return
+            
+            print("\nDoctor information updated")
             
         except ValueError:
             print("Invalid doctor ID")
         
         self.wait_for_key()
     
-    def manage_doctor_specialisations(self, doctor: Doctor) -> None:
+    def manage_doctor_specialisations(self, doctor: Doctor) -> bool:
         """Manage doctor specialisation
         
         Args:
             doctor (Doctor): The doctor whose specialisations are being managed
-        """
-        while True:
-            self.print_header(f"Manage Doctor {doctor.full_name} Specialisation")
             
-            print("Current specialisation:")
-            if doctor.specialisation:
-                for i, spec in enumerate(doctor.specialisation, 1):
-                    print(f"{i}. {spec}")
-            else:
-                print("(None)")
-            
-            print("\nSelect an option:")
-            print("1. Add Specialisation")
-            print("2. Delete Specialisation")
-            print("0. Return")
-            
-            choice = input("\nSelect: ").strip()
-            
-            if choice == "0":
-                return
-                
-            if choice == "1":
-                # Add specialisation, support adding multiple at once, separated by semicolon
-                spec_input = input("Specialisation (use semicolon ';' to separate multiple specialisations): ").strip()
-                new_specs = [spec.strip() for spec in spec_input.split(';') if spec.strip()]
-                
-                # Add each specialisation
-                added_count = 0
-                for new_spec in new_specs:
-                    doctor.add_specialisation(new_spec)
-                    added_count += 1
+        Returns:
+            bool: Whether any specialisation was added or deleted
+        """
+        modified = False
+        # Changes made on this screen are written once, on leaving it
+        with self.__doctor_repo.batch():
+            while True:
+                self.print_header(f"Manage Doctor {doctor.full_name} Specialisation")
                 
-                if added_count > 0:
-                    try:
-                        self.__doctor_repo.update(doctor)
-                        print(f"Added {added_count} specialisations")
-                    except Exception as e:
-                        print(f"Failed to update: {str(e)}")
+                print("Current specialisation:")
+                if doctor.specialisation:
+                    self._write_lines(f"{i}. {spec}" for i, spec in enumerate(doctor.specialisation, 1))
                 else:
-                    print("No specialisations added")
-                self.wait_for_key()
-            elif choice == "2":
-                if not doctor.specialisation:
-                    print("No specialisations to delete")
-                    self.wait_for_key()
-                    continue
+                    print("(None)")
                 
-                # Display specialisation list with index
-                print("\nCurrent specialisation:")
-                for i, spec in enumerate(doctor.specialisation, 1):
-                    print(f"{i}. {spec}")
+                print("\nSelect an option:")
+                print("1. Add Specialisation")
+                print("2. Delete Specialisation")
+                print("0. Return")
                 
-                try:
+                choice = input("\nSelect: ").strip()
+                
+                if choice == "0":
+                    return modified
+                    
+                if choice == "1":
+                    # Add specialisation, support adding multiple at once, separated by semicolon
+                    spec_input = input("Specialisation (use semicolon ';' to separate multiple specialisations): ").strip()
+                    new_specs = [spec for spec in _SPEC_SEP_RE.split(spec_input) if spec]
+                    
+                    # Add each specialisation
+                    added_count = 0
+                    for new_spec in new_specs:
+                        doctor.add_specialisation(new_spec)
+                        added_count += 1
+                    
+                    if added_count > 0:
+                        try:
+                            self.__doctor_repo.update(doctor)
+                            modified = True
+                            print(f"Added {added_count} specialisations")
+                        except Exception as e:
+                            print(f"Failed to update: {str(e)}")
+                    else:
+                        print("No specialisations added")
+                    self.wait_for_key()
+                elif choice == "2":
+                    if not doctor.specialisation:
+                        print("No specialisations to delete")
+                        self.wait_for_key()
+                        continue
+                    
+                    # Display specialisation list with index
+                    print("\nCurrent specialisation:")
+                    self._write_lines(f"{i}. {spec}" for i, spec in enumerate(doctor.specialisation, 1))
+                    
                     # Support deleting multiple specialisations, separated by comma
                     index_input = input("\nEnter specialisation index to delete (multiple with comma): ").strip()
-                    indexes = [int(idx.strip()) for idx in index_input.split(',') if idx.strip().isdigit()]
+                    tokens = [token.strip() for token in index_input.split(',') if token.strip()]
+                    indexes = {int(token) for token in tokens if token.isdecimal()}
+                    invalid_tokens = [token for token in tokens if not token.isdecimal()]
+                    if invalid_tokens:
+                        print(f"Ignored invalid index: {', '.join(invalid_tokens)}")
                     
-                    # Sort and reverse, delete from back to front to avoid index change issues
-                    indexes.sort(reverse=True)
+                    # Split the list in one pass instead of removing entries one by one
+                    kept_specs = []
                     removed_specs = []
-                    
-                    for idx in indexes:
-                        if 1 <= idx <= len(doctor.specialisation):
-                            spec_to_remove = doctor.specialisation[idx-1]
-                            doctor.remove_specialisation(spec_to_remove)
-                            removed_specs.append(spec_to_remove)
+                    for i, spec in enumerate(doctor.specialisation, 1):
+                        if i in indexes:
+                            removed_specs.append(spec)
+                        else:
+                            kept_specs.append(spec)
                     
                     if removed_specs:
+                        doctor.specialisation = kept_specs
                         try:
                             self.__doctor_repo.update(doctor)
+                            modified = True
                             print(f"Deleted specialisation: {', '.join(removed_specs)}")
                         except Exception as e:
                             print(f"Failed to update: {str(e)}")
                     else:
                         print("No specialisations deleted")
-                except ValueError:
-                    print("Enter valid number")
-                self.wait_for_key()
-            else:
-                print("Invalid option")
-                self.wait_for_key()
+                    self.wait_for_key()
+                else:
+                    print("Invalid option")
+                    self.wait_for_key()
     
     def delete_doctor(self) -> None:
         """Delete a doctor"""
@@ -566,63 +676,70 @@ class ClinicController:
                 self.wait_for_key()
                 return
             
-            while True:
-                self.print_header(f"Manage Doctor {doctor.full_name} Clinic Association")
-                
-                # Display current associated clinics
-                print("Current associated clinics:")
-                if doctor.assigned_clinics:
-                    for clinic_id in doctor.assigned_clinics:
-                        clinic = self.__clinic_repo.get_by_id(clinic_id)
-                        if clinic:
-                            print(f"ID: {clinic.id}, Name: {clinic.name}, Suburb: {clinic.suburb}")
-                else:
-                    print("(None)")
-                
-                print("\nSelect an option:")
-                print("1. Add Clinic Association")
-                print("2. Remove Clinic Association")
-                print("0. Return")
-                
-                choice = input("\nSelect: ").strip()
-                
-                if choice == "0":
-                    return
+            # Association changes made on this screen are written once, on leaving it
+            with self.__doctor_repo.batch():
+                while True:
+                    self.print_header(f"Manage Doctor {doctor.full_name} Clinic Association")
                     
-                if choice == "1":
-                    self.add_clinic_to_doctor(doctor)
-                elif choice == "2":
-                    self.remove_clinic_from_doctor(doctor)
-                else:
-                    print("Invalid option")
-                    self.wait_for_key()
+                    # The add option reuses the map instead of loading clinics again
+                    clinic_map = self._clinic_map()
+                    
+                    # Display current associated clinics
+                    print("Current associated clinics:")
+                    if doctor.assigned_clinics:
+                        self._write_lines(_clinic_item(clinic_map[clinic_id])
+                                          for clinic_id in doctor.assigned_clinics if clinic_id in clinic_map)
+                    else:
+                        print("(None)")
+                    
+                    print("\nSelect an option:")
+                    print("1. Add Clinic Association")
+                    print("2. Remove Clinic Association")
+                    print("0. Return")
+                    
+                    choice = input("\nSelect: ").strip()
+                    
+                    if choice == "0":
+                        return
+                        
+                    if choice == "1":
+                        self.add_clinic_to_doctor(doctor, clinic_map)
+                    elif choice == "2":
+                        self.remove_clinic_from_doctor(doctor)
+                    else:
+                        print("Invalid option")
+                        self.wait_for_key()
             
         except ValueError:
             print("Invalid doctor ID")
             self.wait_for_key()
+        except IOError as e:
+            # Nothing was saved, the doctor is read again from the file next time
+            print(f"Failed to update: {str(e)}")
+            self.wait_for_key()
     
-    def add_clinic_to_doctor(self, doctor: Doctor) -> None:
+    def add_clinic_to_doctor(self, doctor: Doctor, clinic_map: Optional[Dict[int, Clinic]] = None) -> None:
         """Add clinic association to doctor
         
         Args:
             doctor (Doctor): The doctor to add clinic association to
+            clinic_map (Optional[Dict[int, Clinic]]): All clinics by ID if already loaded by the caller
         """
         self.print_header(f"Add Clinic to Doctor {doctor.full_name}")
         
         # Display all clinics
-        clinics = self.__clinic_repo.get_all()
+        if clinic_map is None:
+            clinic_map = self._clinic_map()
         
-        if not clinics:
+        if not clinic_map:
             print("No clinic records in the system")
             self.wait_for_key()
             return
         
         print("Available clinics:")
-        available_clinics = []
-        for clinic in clinics:
-            if clinic.id not in doctor.assigned_clinics:
-                available_clinics.append(clinic)
-                print(f"ID: {clinic.id}, Name: {clinic.name}, Suburb: {clinic.suburb}")
+        assigned = doctor.assigned_clinics_set
+        available_clinics = [clinic for clinic in clinic_map.values() if clinic.id not in assigned]
+        self._write_lines(map(_clinic_item, available_clinics))
         
         if not available_clinics:
             print("No clinics to add")
@@ -636,14 +753,14 @@ class ClinicController:
                 return
             
             # Check if clinic ID is valid
-            clinic = self.__clinic_repo.get_by_id(clinic_id)
+            clinic = clinic_map.get(clinic_id)
             if not clinic:
                 print(f"Cannot find clinic with ID {clinic_id}")
                 self.wait_for_key()
                 return
             
             # Check if already associated
-            if clinic.id in doctor.assigned_clinics:
+            if clinic.id in assigned:
                 print(f"Doctor already associated with clinic {clinic.name}")
                 self.wait_for_key()
                 return
@@ -677,10 +794,9 @@ class ClinicController:
             return
         
         print("Current associated clinics:")
-        for clinic_id in doctor.assigned_clinics:
-            clinic = self.__clinic_repo.get_by_id(clinic_id)
-            if clinic:
-                print(f"ID: {clinic.id}, Name: {clinic.name}, Suburb: {clinic.suburb}")
+        clinic_map = self._clinic_map()
+        self._write_lines(_clinic_item(clinic_map[clinic_id])
+                          for clinic_id in doctor.assigned_clinics if clinic_id in clinic_map)
         
         try:
             clinic_id = int(input("\nEnter clinic ID to remove (0 to return): ").strip())
@@ -689,13 +805,13 @@ class ClinicController:
                 return
             
             # Check if clinic ID is associated
-            if clinic_id not in doctor.assigned_clinics:
+            if not doctor.is_working_in_clinic(clinic_id):
                 print(f"Doctor not associated with ID {clinic_id} clinic")
                 self.wait_for_key()
                 return
             
             # Get clinic name
-            clinic = self.__clinic_repo.get_by_id(clinic_id)
+            clinic = clinic_map.get(clinic_id)
             clinic_name = clinic.name if clinic else f"ID {clinic_id}"
             
             # Remove association
@@ -735,12 +851,7 @@ class ClinicController:
             return
         
         print(f"\nFound {len(doctors)} matching doctors:")
-        print(f"{'ID':<5}{'Name':<15}{'Email':<25}{'Specialisation':<25}")
-        print("-" * 70)
-        
-        for doctor in doctors:
-            specialisations = ", ".join(doctor.specialisation)
-            print(f"{doctor.id:<5}{doctor.full_name:<15}{doctor.email:<25}{specialisations:<25}")
+        self._render_table(_DOCTOR_TABLE_HEAD, doctors, _doctor_row)
         
         self.wait_for_key()
     
@@ -5,6 +5,11 @@
 Appointment Entity Class
 """
 
+import sys
+
+from src.config import STATUS
+from src.utils.date_util import DateUtil
+
 class Appointment:
     """<<Entity>> Appointment Entity Class"""
     
@@ -38,9 +43,10 @@ class Appointment:
         self.__doctor_id = int(doctor_id) if doctor_id is not None else None
         self.__clinic_id = int(clinic_id) if clinic_id is not None else None
         self.__date = str(date) if date is not None else None
+        self.__date_key = None  # Integer form of date, built on first use
         self.__time_slot = int(time_slot) if time_slot is not None else None
-        self.__reason = str(reason) if reason is not None else None
-        self.__status = str(status) if status is not None else None
+        self.__reason = sys.intern(str(reason)) if reason is not None else None
+        self.__status = sys.intern(str(status)) if status is not None else None
     
     # Accessor methods
     @property
@@ -88,6 +94,17 @@ class Appointment:
         """
         return self.__date
     
+    @property
+    def date_key(self) -> int:
+        """Get date as a YYYYMMDD integer for ordering comparisons
+        
+        Returns:
+            int: Date key
+        """
+        if self.__date_key is None:
+            self.__date_key = DateUtil.date_key(self.__date)
+        return self.__date_key
+    
     @property
     def time_slot(self) -> int:
         """Get time slot index
@@ -161,6 +178,7 @@ class Appointment:
             date (str): Date
         """
         self.__date = str(date) if date is not None else None
+        self.__date_key = None
     
     @time_slot.setter
     def time_slot(self, time_slot: int) -> None:
@@ -178,7 +196,7 @@ class Appointment:
         Args:
             reason (str): Appointment reason
         """
-        self.__reason = str(reason) if reason is not None else None
+        self.__reason = sys.intern(str(reason)) if reason is not None else None
     
     @status.setter
     def status(self, status: str) -> None:
@@ -187,7 +205,7 @@ class Appointment:
         Args:
             status (str): Appointment status
         """
-        self.__status = str(status) if status is not None else None
+        self.__status = sys.intern(str(status)) if status is not None else None
     
     # Business methods
     def is_scheduled(self) -> bool:
@@ -196,7 +214,7 @@ class Appointment:
         Returns:
             bool: True if appointment is scheduled, False otherwise
         """
-        return self.__status == "Scheduled"
+        return self.__status == STATUS.SCHEDULED
     
     def is_completed(self) -> bool:
         """Check if appointment is completed
@@ -204,7 +222,7 @@ class Appointment:
         Returns:
             bool: True if appointment is completed, False otherwise
         """
-        return self.__status == "Completed"
+        return self.__status == STATUS.COMPLETED
     
     def is_cancelled(self) -> bool:
         """Check if appointment is cancelled
@@ -212,23 +230,23 @@ class Appointment:
         Returns:
             bool: True if appointment is cancelled, False otherwise
         """
-        return self.__status == "Cancelled by Patient" or self.__status == "Cancelled by Clinic"
+        return self.__status == STATUS.CANCELLED_BY_PATIENT or self.__status == STATUS.CANCELLED_BY_CLINIC
     
     def mark_as_scheduled(self) -> None:
         """Mark appointment as scheduled"""
-        self.__status = "Scheduled"
+        self.__status = STATUS.SCHEDULED
     
     def mark_as_completed(self) -> None:
         """Mark appointment as completed"""
-        self.__status = "Completed"
+        self.__status = STATUS.COMPLETED
     
     def cancel_by_patient(self) -> None:
         """Cancel appointment by patient"""
-        self.__status = "Cancelled by Patient"
+        self.__status = STATUS.CANCELLED_BY_PATIENT
     
     def cancel_by_clinic(self) -> None:
         """Cancel appointment by clinic"""
-        self.__status = "Cancelled by Clinic"
+        self.__status = STATUS.CANCELLED_BY_CLINIC
     
     def __str__(self) -> str:
         """Return string representation of appointment
@@ -5,7 +5,7 @@
 Doctor Entity Class
 """
 
-from typing import List
+from typing import FrozenSet, List
 
 class Doctor:
     """<<Entity>> Doctor Entity Class"""
@@ -25,6 +25,8 @@ class Doctor:
         self.__email = str(email) if email is not None else None
         self.__assigned_clinics = assigned_clinics if assigned_clinics else []
         self.__specialisation = specialisation if specialisation else []
+        self.__specialisation_str = None  # Joined specialisations, built on first use
+        self.__assigned_clinics_set = None  # Assigned clinic IDs as a set, built on first use
     
     # Accessor methods
     @property
@@ -63,6 +65,17 @@ class Doctor:
         """
         return self.__assigned_clinics
     
+    @property
+    def assigned_clinics_set(self) -> FrozenSet[int]:
+        """Get assigned clinic IDs as a set for membership tests
+        
+        Returns:
+            FrozenSet[int]: Assigned clinic IDs
+        """
+        if self.__assigned_clinics_set is None:
+            self.__assigned_clinics_set = frozenset(self.__assigned_clinics)
+        return self.__assigned_clinics_set
+    
     @property
     def specialisation(self) -> List[str]:
         """Get list of specialisations
@@ -72,6 +85,17 @@ class Doctor:
         """
         return self.__specialisation
     
+    @property
+    def specialisation_str(self) -> str:
+        """Get specialisations as a comma separated string for display
+        
+        Returns:
+            str: Comma separated specialisations
+        """
+        if self.__specialisation_str is None:
+            self.__specialisation_str = ", ".join(self.__specialisation)
+        return self.__specialisation_str
+    
     # Modifier methods
     @full_name.setter
     def full_name(self, full_name: str) -> None:
@@ -99,6 +123,7 @@ class Doctor:
             assigned_clinics (List[int]): List of assigned clinic IDs
         """
         self.__assigned_clinics = assigned_clinics if assigned_clinics else []
+        self.__assigned_clinics_set = None
     
     @specialisation.setter
     def specialisation(self, specialisation: List[str]) -> None:
@@ -108,6 +133,7 @@ class Doctor:
             specialisation (List[str]): List of specialisations
         """
         self.__specialisation = specialisation if specialisation else []
+        self.__specialisation_str = None
     
     # Business methods
     def add_clinic(self, clinic_id: int) -> None:
@@ -116,8 +142,9 @@ class Doctor:
         Args:
             clinic_id (int): Clinic ID
         """
-        if clinic_id not in self.__assigned_clinics:
+        if clinic_id not in self.assigned_clinics_set:
             self.__assigned_clinics.append(clinic_id)
+            self.__assigned_clinics_set = None
     
     def remove_clinic(self, clinic_id: int) -> None:
         """Remove clinic from doctor's assigned clinics
@@ -125,8 +152,9 @@ class Doctor:
         Args:
             clinic_id (int): Clinic ID
         """
-        if clinic_id in self.__assigned_clinics:
+        if clinic_id in self.assigned_clinics_set:
             self.__assigned_clinics.remove(clinic_id)
+            self.__assigned_clinics_set = None
     
     def add_specialisation(self, specialisation: str) -> None:
         """Add specialisation to doctor's specialisations
@@ -136,6 +164,7 @@ class Doctor:
         """
         if specialisation not in self.__specialisation:
             self.__specialisation.append(specialisation)
+            self.__specialisation_str = None
     
     def remove_specialisation(self, specialisation: str) -> None:
         """Remove specialisation from doctor's specialisations
@@ -145,6 +174,7 @@ class Doctor:
         """
         if specialisation in self.__specialisation:
             self.__specialisation.remove(specialisation)
+            self.__specialisation_str = None
     
     def is_working_in_clinic(self, clinic_id: int) -> bool:
         """Check if doctor is working in specified clinic
@@ -155,7 +185,7 @@ class Doctor:
         Returns:
             bool: True if doctor is working in specified clinic, False otherwise
         """
-        return clinic_id in self.__assigned_clinics
+        return clinic_id in self.assigned_clinics_set
     
     def has_specialisation(self, specialisation: str) -> bool:
         """Check if doctor has specified specialisation
@@ -5,6 +5,23 @@
 Doctor Schedule Entity Class
 """
 
+def _parse_time_slots(time_slots) -> int:
+    """Parse a hexadecimal time slot string into a bitmap
+    
+    Args:
+        time_slots (str): Time slots represented in hexadecimal
+        
+    Returns:
+        int: Time slot bitmap, 0 if the string is empty or not hexadecimal
+    """
+    if not time_slots:
+        return 0
+    try:
+        return int(time_slots, 16)
+    except ValueError:
+        return 0
+
+
 class DoctorSchedule:
     """<<Entity>> Doctor Schedule Entity Class"""
     
@@ -21,6 +38,7 @@ class DoctorSchedule:
         self.__doctor_id = int(doctor_id) if doctor_id is not None else None
         self.__clinic_id = int(clinic_id) if clinic_id is not None else None
         self.__time_slots = str(time_slots) if time_slots is not None else None
+        self.__time_slots_int = _parse_time_slots(self.__time_slots)  # Parsed once, bit i is slot index i
     
     # Accessor methods
     @property
@@ -59,6 +77,15 @@ class DoctorSchedule:
         """
         return self.__time_slots
     
+    @property
+    def time_slots_int(self) -> int:
+        """Get time slots as a bitmap
+        
+        Returns:
+            int: Time slot bitmap, bit i set when time slot index i is available
+        """
+        return self.__time_slots_int
+    
     # Modifier methods
     @doctor_id.setter
     def doctor_id(self, doctor_id: int) -> None:
@@ -86,6 +113,7 @@ class DoctorSchedule:
             time_slots (str): Time slots represented in hexadecimal
         """
         self.__time_slots = str(time_slots) if time_slots is not None else None
+        self.__time_slots_int = _parse_time_slots(self.__time_slots)
     
     # Business methods
     def is_available(self, time_slot_index: int) -> bool:
@@ -97,14 +125,8 @@ class DoctorSchedule:
         Returns:
             bool: True if time slot is available, False otherwise
         """
-        if not self.__time_slots:
-            return False
-        
-        # Convert hexadecimal string to integer
-        time_slots_int = int(self.__time_slots, 16)
-        
         # Check if the corresponding bit is 1 (available)
-        return (time_slots_int & (1 << time_slot_index)) != 0
+        return (self.__time_slots_int & (1 << time_slot_index)) != 0
     
     def set_available(self, time_slot_index: int) -> None:
         """Set specified time slot as available
@@ -112,17 +134,11 @@ class DoctorSchedule:
         Args:
             time_slot_index (int): Time slot index (0-15)
         """
-        if not self.__time_slots:
-            self.__time_slots = "0"
-        
-        # Convert hexadecimal string to integer
-        time_slots_int = int(self.__time_slots, 16)
-        
         # Set the corresponding bit to 1 (available)
-        time_slots_int |= (1 << time_slot_index)
+        self.__time_slots_int |= (1 << time_slot_index)
         
-        # Convert back to hexadecimal string
-        self.__time_slots = format(time_slots_int, 'x')
+        # Keep the hexadecimal string in step for storage
+        self.__time_slots = format(self.__time_slots_int, 'x')
     
     def set_unavailable(self, time_slot_index: int) -> None:
         """Set specified time slot as unavailable
@@ -133,14 +149,11 @@ class DoctorSchedule:
         if not self.__time_slots:
             return
         
-        # Convert hexadecimal string to integer
-        time_slots_int = int(self.__time_slots, 16)
-        
         # Set the corresponding bit to 0 (unavailable)
-        time_slots_int &= ~(1 << time_slot_index)
+        self.__time_slots_int &= ~(1 << time_slot_index)
         
-        # Convert back to hexadecimal string
-        self.__time_slots = format(time_slots_int, 'x')
+        # Keep the hexadecimal string in step for storage
+        self.__time_slots = format(self.__time_slots_int, 'x')
     
     def __str__(self) -> str:
         """Return string representation of doctor schedule
@@ -9,17 +9,94 @@ import os
 from typing import List, Optional
 from datetime import datetime
 from src.entities.appointment import Appointment
+from src.config import APPOINTMENTS_FILE, slot_mask
 from src.repositories.base_repository import BaseRepository
 from src.repositories.doctor_schedule_repository import DoctorScheduleRepository
+from src.utils.date_util import DateUtil
 
 class AppointmentRepository(BaseRepository[Appointment]):
     """Appointment Repository Class"""
     
     def __init__(self):
         """Initialize appointment repository"""
-        data_file = os.path.join("data", "appointments.csv")
-        super().__init__(data_file, Appointment)
+        super().__init__(APPOINTMENTS_FILE, Appointment)
         self.__schedule_repo = DoctorScheduleRepository()
+        # Indexes over the data file, rebuilt when it changes
+        self.__all_appointments = None
+        self.__user_index = None
+        self.__clinic_index = None
+        self.__doctor_index = None
+        self.__date_index = None
+        self.__booked_index = None
+        self.__index_stamp = None
+    
+    def _invalidate_rows(self) -> None:
+        """Drop the cached rows and the indexes after a write"""
+        super()._invalidate_rows()
+        self.__user_index = None
+        self.__index_stamp = None
+    
+    def _load_indexes(self) -> None:
+        """Rebuild the indexes if they are missing or the data file has changed
+        
+        The indexed appointments are private to this repository, queries hand out copies of them.
+        """
+        stat = os.stat(self.data_file)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self.__user_index is not None and stamp == self.__index_stamp:
+            return
+        
+        appointments = self.get_all()
+        user_index = {}
+        clinic_index = {}
+        doctor_index = {}
+        date_index = {}
+        booked_index = {}
+        for appointment in appointments:
+            user_index.setdefault(appointment.user_id, []).append(appointment)
+            clinic_index.setdefault(appointment.clinic_id, []).append(appointment)
+            doctor_index.setdefault(appointment.doctor_id, []).append(appointment)
+            date_index.setdefault(appointment.date, []).append(appointment)
+            if appointment.is_scheduled() and appointment.time_slot and appointment.time_slot > 0:
+                key = (appointment.doctor_id, appointment.date)
+                booked_index[key] = booked_index.get(key, 0) | slot_mask(appointment.time_slot - 1)
+        
+        self.__all_appointments = appointments
+        self.__user_index = user_index
+        self.__clinic_index = clinic_index
+        self.__doctor_index = doctor_index
+        self.__date_index = date_index
+        self.__booked_index = booked_index
+        self.__index_stamp = stamp
+    
+    @staticmethod
+    def _copies(appointments) -> List[Appointment]:
+        """Build fresh appointments from indexed ones, so callers may modify them freely
+        
+        Args:
+            appointments: Indexed appointments
+            
+        Returns:
+            List[Appointment]: New appointment entities, in the same order
+        """
+        return [Appointment.from_dict(appointment.to_dict()) for appointment in appointments]
+    
+    def get_booked_slots_bitmap(self, doctor_id: int, date: str) -> int:
+        """Get a doctor's booked time slots on a date as a bitmap
+        
+        Bit i is set when time slot i + 1 has a scheduled appointment, the same layout
+        as doctor schedule time slots. Bookings at any clinic count, as a doctor cannot
+        be in two places at once.
+        
+        Args:
+            doctor_id (int): Doctor ID
+            date (str): Date in format "YYYY-MM-DD"
+            
+        Returns:
+            int: Booked time slot bitmap
+        """
+        self._load_indexes()
+        return self.__booked_index.get((doctor_id, date), 0)
     
     def get_by_user(self, user_id: int) -> List[Appointment]:
         """Get appointments by user ID
@@ -30,8 +107,49 @@ class AppointmentRepository(BaseRepository[Appointment]):
         Returns:
             List[Appointment]: List of appointments
         """
-        appointments = self.get_all()
-        return [appointment for appointment in appointments if appointment.user_id == user_id]
+        self._load_indexes()
+        return self._copies(self.__user_index.get(user_id, ()))
+    
+    def get_by_user_filtered(self, user_id: Optional[int], clinic_id: Optional[int] = None,
+                             doctor_id: Optional[int] = None, date: Optional[str] = None,
+                             date_from: Optional[str] = None, date_before: Optional[str] = None) -> List[Appointment]:
+        """Get a user's appointments matching all given conditions
+        
+        Args:
+            user_id (Optional[int]): User ID, None for all users
+            clinic_id (Optional[int]): Clinic ID
+            doctor_id (Optional[int]): Doctor ID
+            date (Optional[str]): Exact date in format "YYYY-MM-DD"
+            date_from (Optional[str]): Earliest date, inclusive
+            date_before (Optional[str]): Latest date, exclusive
+            
+        Returns:
+            List[Appointment]: List of appointments
+        """
+        # Compare dates as integer keys
+        from_key = DateUtil.date_key(date_from) if date_from is not None else None
+        before_key = DateUtil.date_key(date_before) if date_before is not None else None
+        
+        # Start from the smallest index bucket among the given conditions,
+        # the remaining conditions are checked on that bucket only
+        self._load_indexes()
+        buckets = [index.get(key, ()) for index, key in ((self.__user_index, user_id),
+                                                         (self.__clinic_index, clinic_id),
+                                                         (self.__doctor_index, doctor_id),
+                                                         (self.__date_index, date))
+                   if key is not None]
+        candidates = min(buckets, key=len) if buckets else self.__all_appointments
+        
+        matches = [appointment for appointment in candidates
+                   if (user_id is None or appointment.user_id == user_id)
+                   and (clinic_id is None or appointment.clinic_id == clinic_id)
+                   and (doctor_id is None or appointment.doctor_id == doctor_id)
+                   and (date is None or appointment.date == date)
+                   and (from_key is None or appointment.date_key >= from_key)
+                   and (before_key is None or appointment.date_key < before_key)]
+        if user_id is None:
+            matches.sort(key=lambda appointment: appointment.id)
+        return self._copies(matches)
     
     # Compatible with legacy code
     def get_by_patient(self, patient_email: str) -> List[Appointment]:
@@ -69,8 +187,8 @@ class AppointmentRepository(BaseRepository[Appointment]):
         Returns:
             List[Appointment]: List of appointments
         """
-        appointments = self.get_all()
-        return [appointment for appointment in appointments if appointment.doctor_id == doctor_id]
+        self._load_indexes()
+        return self._copies(self.__doctor_index.get(doctor_id, ()))
     
     def get_by_clinic(self, clinic_id: int) -> List[Appointment]:
         """Get appointments by clinic ID
@@ -81,8 +199,8 @@ class AppointmentRepository(BaseRepository[Appointment]):
         Returns:
             List[Appointment]: List of appointments
         """
-        appointments = self.get_all()
-        return [appointment for appointment in appointments if appointment.clinic_id == clinic_id]
+        self._load_indexes()
+        return self._copies(self.__clinic_index.get(clinic_id, ()))
     
     def get_by_date(self, date: str) -> List[Appointment]:
         """Get appointments by date
@@ -93,8 +211,8 @@ class AppointmentRepository(BaseRepository[Appointment]):
         Returns:
             List[Appointment]: List of appointments
         """
-        appointments = self.get_all()
-        return [appointment for appointment in appointments if appointment.date == date]
+        self._load_indexes()
+        return self._copies(self.__date_index.get(date, ()))
     
     def get_scheduled_appointments(self) -> List[Appointment]:
         """Get list of scheduled appointments
@@ -130,10 +248,10 @@ class AppointmentRepository(BaseRepository[Appointment]):
             List[Appointment]: List of appointments
         """
         appointments = self.get_all()
-        today = datetime.now().strftime("%Y-%m-%d")
+        today_key = DateUtil.date_key(datetime.now().strftime("%Y-%m-%d"))
         
         return [appointment for appointment in appointments 
-                if appointment.date >= today and appointment.is_scheduled()]
+                if appointment.date_key >= today_key and appointment.is_scheduled()]
     
     def get_by_doctor_date_slot(self, doctor_id: int, date: str, time_slot: int) -> Optional[Appointment]:
         """Get appointment by doctor ID, date and time slot
@@ -6,7 +6,7 @@ Base Repository Class
 """
 
 import os
-from typing import List, Dict, Any, TypeVar, Generic, Type, Optional
+from typing import List, Dict, Any, TypeVar, Generic, Type, Optional, Callable, Tuple
 from src.utils.file_util import FileUtil
 from src.utils.id_generator import IdGenerator
 
@@ -31,17 +31,139 @@ class BaseRepository(Generic[T]):
         # Get entity type
         file_name = os.path.basename(data_file)
         self.entity_type = os.path.splitext(file_name)[0]
+        
+        # Parsed CSV rows, kept until the file's (mtime, size) stamp changes or this repository writes
+        self.__rows = None
+        self.__rows_stamp = None
+        # Lookup dicts over the cached rows, keyed by field name and rebuilt when the rows are re-read
+        self.__row_indexes: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # Lowercased search text per row, paired with the row, for the same lifetime
+        self.__search_blobs: Optional[List[Tuple[str, Dict[str, Any]]]] = None
+        # Bumped whenever the contents may have changed, see version
+        self.__version = 0
+    
+    @property
+    def version(self) -> int:
+        """Get a counter that changes whenever the repository's contents may have changed
+        
+        Callers can keep entities built from get_all and reuse them while the version stays the same.
+        
+        Returns:
+            int: Contents version
+        """
+        self._read_rows()
+        return self.__version
+    
+    def _mark_changed(self) -> None:
+        """Bump the contents version without touching the cached rows"""
+        self.__version += 1
+    
+    def _read_rows(self) -> List[Dict[str, Any]]:
+        """Read the CSV rows, reusing the last parse while the file is unchanged
+        
+        Returns:
+            List[Dict[str, Any]]: Rows as dictionaries, shared between calls and not to be modified
+        """
+        try:
+            stat = os.stat(self.data_file)
+        except OSError:
+            self._mark_changed()
+            return FileUtil.read_csv(self.data_file)
+        
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self.__rows is None or stamp != self.__rows_stamp:
+            self.__rows = FileUtil.read_csv(self.data_file)
+            self.__rows_stamp = stamp
+            self._mark_changed()
+            self.__row_indexes = {}
+            self.__search_blobs = None
+        return self.__rows
+    
+    def _invalidate_rows(self) -> None:
+        """Drop the cached rows and lookup dicts after a write"""
+        self.__rows = None
+        self.__row_indexes = {}
+        self.__search_blobs = None
+    
+    def _row_index(self, field: str, normalise: Callable[[str], str] = str) -> Dict[str, Dict[str, Any]]:
+        """Get a dict from a field's value to its row, built once per read of the data file
+        
+        Args:
+            field (str): Column name
+            normalise (Callable[[str], str], optional): Applied to the value before it is used as a key. Defaults to str.
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: Normalised value to row, the first row wins when values repeat
+        """
+        rows = self._read_rows()
+        index = self.__row_indexes.get(field)
+        if index is None:
+            index = {}
+            for row in rows:
+                index.setdefault(normalise(row.get(field) or ""), row)
+            self.__row_indexes[field] = index
+        return index
+    
+    def _search_blobs(self, make_blob: Callable[[Dict[str, Any]], str]) -> List[Tuple[str, Dict[str, Any]]]:
+        """Get each row's lowercased search text, built once per read of the data file
+        
+        Args:
+            make_blob (Callable[[Dict[str, Any]], str]): Builds a row's search text, fields should be
+                separated by newlines so a keyword cannot match across two fields
+            
+        Returns:
+            List[Tuple[str, Dict[str, Any]]]: (search text, row) pairs in file order
+        """
+        rows = self._read_rows()
+        if self.__search_blobs is None:
+            self.__search_blobs = [(make_blob(row).lower(), row) for row in rows]
+        return self.__search_blobs
+    
+    def _find_by(self, field: str, value, normalise: Callable[[str], str] = str) -> Optional[T]:
+        """Get the entity whose field matches value, through the field's lookup dict
+        
+        Args:
+            field (str): Column name
+            value: Value to look up
+            normalise (Callable[[str], str], optional): Applied to both sides before comparing. Defaults to str.
+            
+        Returns:
+            Optional[T]: Freshly built entity, None if not found
+        """
+        row = self._row_index(field, normalise).get(normalise(str(value)))
+        return self.entity_class.from_dict(row) if row is not None else None
+    
+    @staticmethod
+    def _to_row(entity: T) -> Dict[str, Any]:
+        """Convert an entity to a CSV row
+        
+        Args:
+            entity (T): Entity
+            
+        Returns:
+            Dict[str, Any]: Entity dictionary with lists joined into semicolon-separated strings
+        """
+        entity_dict = entity.to_dict()
+        
+        # Convert lists to semicolon-separated strings (for CSV storage)
+        for key, value in entity_dict.items():
+            if isinstance(value, list):
+                entity_dict[key] = ";".join([str(item) for item in value])
+        
+        return entity_dict
     
     def get_all(self) -> List[T]:
         """Get all entities
         
+        Entities are built fresh on every call, so callers may modify them freely.
+        
         Returns:
             List[T]: List of entities
         """
         entities = []
         
         # Read CSV file
-        rows = FileUtil.read_csv(self.data_file)
+        rows = self._read_rows()
         
         # Convert to entity objects
         for row in rows:
@@ -59,13 +181,7 @@ class BaseRepository(Generic[T]):
         Returns:
             Optional[T]: Entity, returns None if not found
         """
-        entities = self.get_all()
-        
-        for entity in entities:
-            if str(entity.id) == str(entity_id):
-                return entity
-        
-        return None
+        return self._find_by("id", entity_id)
     
     def add(self, entity: T) -> T:
         """Add entity
@@ -85,16 +201,12 @@ class BaseRepository(Generic[T]):
             # Assuming entity class's id is stored in _Entity__id (Python name mangling)
             setattr(entity, f"_{entity.__class__.__name__}__id", next_id)
         
-        # Convert entity to dictionary
-        entity_dict = entity.to_dict()
-        
-        # Convert lists to semicolon-separated strings (for CSV storage)
-        for key, value in entity_dict.items():
-            if isinstance(value, list):
-                entity_dict[key] = ";".join([str(item) for item in value])
+        # Convert entity to a CSV row
+        entity_dict = self._to_row(entity)
         
         # Append to CSV file
         FileUtil.append_csv(self.data_file, entity_dict)
+        self._invalidate_rows()
         
         return entity
     
@@ -107,13 +219,8 @@ class BaseRepository(Generic[T]):
         Returns:
             T: Updated entity
         """
-        # Convert entity to dictionary
-        entity_dict = entity.to_dict()
-        
-        # Convert lists to semicolon-separated strings (for CSV storage)
-        for key, value in entity_dict.items():
-            if isinstance(value, list):
-                entity_dict[key] = ";".join([str(item) for item in value])
+        # Convert entity to a CSV row
+        entity_dict = self._to_row(entity)
         
         # Update row in CSV file
         FileUtil.update_row(
@@ -121,9 +228,39 @@ class BaseRepository(Generic[T]):
             lambda row: str(row.get('id')) == str(entity.id),
             entity_dict
         )
+        self._invalidate_rows()
         
         return entity
     
+    def update_many(self, entities: List[T]) -> List[T]:
+        """Update several entities with a single rewrite of the data file
+        
+        Args:
+            entities (List[T]): Entities to update
+            
+        Returns:
+            List[T]: Updated entities
+            
+        Raises:
+            IOError: If the data file could not be written, it is left unchanged
+        """
+        updates = {str(entity.id): self._to_row(entity) for entity in entities}
+        if not updates:
+            return entities
+        
+        rows = FileUtil.read_csv(self.data_file)
+        for row in rows:
+            entity_dict = updates.get(str(row.get('id')))
+            if entity_dict:
+                row.update(entity_dict)
+        
+        written = FileUtil.write_csv(self.data_file, rows)
+        self._invalidate_rows()
+        if not written:
+            raise IOError(f"Could not write {self.data_file}")
+        
+        return entities
+    
     def delete(self, entity_id) -> bool:
         """Delete entity
         
@@ -134,10 +271,12 @@ class BaseRepository(Generic[T]):
             bool: Whether deletion was successful
         """
         # Delete row from CSV file
-        return FileUtil.delete_row(
+        deleted = FileUtil.delete_row(
             self.data_file,
             lambda row: str(row.get('id')) == str(entity_id)
         )
+        self._invalidate_rows()
+        return deleted
     
     def _save_all(self, entities: List[T]) -> None:
         """Save all entities to file
@@ -149,4 +288,5 @@ class BaseRepository(Generic[T]):
         rows = [entity.to_dict() for entity in entities]
         
         # Write to CSV file
-        FileUtil.write_csv(self.data_file, rows) 
\ No newline at end of file
+        FileUtil.write_csv(self.data_file, rows)
+        self._invalidate_rows() 
\ No newline at end of file
@@ -5,18 +5,21 @@
 Clinic Repository Class
 """
 
-import os
-from typing import List, Optional
+from typing import Dict, List, Optional
 from src.entities.clinic import Clinic
+from src.config import CLINICS_FILE
 from src.repositories.base_repository import BaseRepository
 
+def _clinic_search_text(row: Dict[str, str]) -> str:
+    """Searchable text of a clinic row: name, suburb and address, one per line"""
+    return f"{row.get('name') or ''}\n{row.get('suburb') or ''}\n{row.get('address') or ''}"
+
 class ClinicRepository(BaseRepository[Clinic]):
     """Clinic Repository Class"""
     
     def __init__(self):
         """Initialize clinic repository"""
-        data_file = os.path.join("data", "clinics.csv")
-        super().__init__(data_file, Clinic)
+        super().__init__(CLINICS_FILE, Clinic)
     
     def get_by_suburb(self, suburb: str) -> List[Clinic]:
         """Get clinics by suburb
@@ -39,13 +42,7 @@ class ClinicRepository(BaseRepository[Clinic]):
         Returns:
             Optional[Clinic]: Clinic if found, None otherwise
         """
-        clinics = self.get_all()
-        
-        for clinic in clinics:
-            if clinic.name.lower() == name.lower():
-                return clinic
-        
-        return None
+        return self._find_by("name", name, str.lower)
     
     def search(self, keyword: str) -> List[Clinic]:
         """Search clinics
@@ -56,10 +53,7 @@ class ClinicRepository(BaseRepository[Clinic]):
         Returns:
             List[Clinic]: List of matching clinics
         """
-        clinics = self.get_all()
         keyword = keyword.lower()
         
-        return [clinic for clinic in clinics if 
-                keyword in clinic.name.lower() or 
-                keyword in clinic.suburb.lower() or 
-                keyword in clinic.address.lower()] 
\ No newline at end of file
+        return [Clinic.from_dict(row) for blob, row in self._search_blobs(_clinic_search_text)
+                if keyword in blob] 
\ No newline at end of file
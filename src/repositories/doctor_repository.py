@@ -5,18 +5,95 @@
 Doctor Repository Class
 """
 
-import os
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
 from src.entities.doctor import Doctor
+from src.config import DOCTORS_FILE
 from src.repositories.base_repository import BaseRepository
 
+def _doctor_search_text(row: Dict[str, str]) -> str:
+    """Searchable text of a doctor row: name, email and each specialisation, one per line"""
+    specialisation = (row.get('specialisation') or '').replace(';', '\n')
+    return f"{row.get('full_name') or ''}\n{row.get('email') or ''}\n{specialisation}"
+
 class DoctorRepository(BaseRepository[Doctor]):
     """Doctor Repository Class"""
     
     def __init__(self):
         """Initialize doctor repository"""
-        data_file = os.path.join("data", "doctors.csv")
-        super().__init__(data_file, Doctor)
+        super().__init__(DOCTORS_FILE, Doctor)
+        # Updates held back while a batch is open, keyed by doctor ID
+        self.__batch_depth = 0
+        self.__pending: Dict[int, Doctor] = {}
+    
+    @contextmanager
+    def batch(self) -> Iterator["DoctorRepository"]:
+        """Defer doctor updates made inside the block to a single write when it exits
+        
+        Batches may be nested, the write happens when the outermost one exits. If the block
+        raises, the held updates are discarded and the data file is left as it was.
+        
+        Yields:
+            DoctorRepository: This repository
+            
+        Raises:
+            IOError: If the held updates could not be written
+        """
+        self.__batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if self.__batch_depth == 1 and self.__pending:
+                self.__pending.clear()
+                self._mark_changed()
+            raise
+        finally:
+            self.__batch_depth -= 1
+            if self.__batch_depth == 0 and self.__pending:
+                pending = list(self.__pending.values())
+                self.__pending.clear()
+                self.update_many(pending)
+    
+    def update(self, doctor: Doctor) -> Doctor:
+        """Update doctor, deferred to the end of the current batch if one is open
+        
+        Args:
+            doctor (Doctor): Doctor to update
+            
+        Returns:
+            Doctor: Updated doctor
+        """
+        if self.__batch_depth:
+            self.__pending[doctor.id] = doctor
+            self._mark_changed()
+            return doctor
+        return super().update(doctor)
+    
+    def get_all(self) -> List[Doctor]:
+        """Get all doctors, including updates still pending in an open batch
+        
+        Returns:
+            List[Doctor]: List of doctors
+        """
+        doctors = super().get_all()
+        if self.__pending:
+            doctors = [self.__pending.get(doctor.id, doctor) for doctor in doctors]
+        return doctors
+    
+    def get_by_id(self, doctor_id) -> Optional[Doctor]:
+        """Get doctor by ID, including updates still pending in an open batch
+        
+        Args:
+            doctor_id: Doctor ID
+            
+        Returns:
+            Optional[Doctor]: Doctor, returns None if not found
+        """
+        for doctor in self.__pending.values():
+            if str(doctor.id) == str(doctor_id):
+                return doctor
+        
+        return super().get_by_id(doctor_id)
     
     def get_by_clinic(self, clinic_id: int) -> List[Doctor]:
         """Get doctors by clinic ID
@@ -51,13 +128,11 @@ class DoctorRepository(BaseRepository[Doctor]):
         Returns:
             Optional[Doctor]: Doctor if found, None otherwise
         """
-        doctors = self.get_all()
-        
-        for doctor in doctors:
+        for doctor in self.__pending.values():
             if doctor.email == email:
                 return doctor
         
-        return None
+        return self._find_by("email", email)
     
     def search(self, keyword: str) -> List[Doctor]:
         """Search doctors
@@ -68,19 +143,16 @@ class DoctorRepository(BaseRepository[Doctor]):
         Returns:
             List[Doctor]: List of matching doctors
         """
-        doctors = self.get_all()
         keyword = keyword.lower()
+        pending = {str(doctor_id): doctor for doctor_id, doctor in self.__pending.items()}
         
         result = []
-        for doctor in doctors:
-            if keyword in doctor.full_name.lower() or keyword in doctor.email.lower():
-                result.append(doctor)
-                continue
-            
-            # Check specialisation
-            for spec in doctor.specialisation:
-                if keyword in spec.lower():
-                    result.append(doctor)
-                    break
+        for blob, row in self._search_blobs(_doctor_search_text):
+            doctor = pending.get(str(row.get('id')))
+            if doctor is not None:
+                # Edited in an open batch, match against the pending version instead
+                blob = _doctor_search_text(self._to_row(doctor)).lower()
+            if keyword in blob:
+                result.append(doctor or Doctor.from_dict(row))
         
         return result 
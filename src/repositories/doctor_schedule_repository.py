@@ -5,10 +5,10 @@
 Doctor Schedule Repository Class
 """
 
-import os
 from typing import List, Optional, Tuple
 from datetime import datetime
 from src.entities.doctor_schedule import DoctorSchedule
+from src.config import DOCTOR_SCHEDULES_FILE, SLOT_INDICES
 from src.repositories.base_repository import BaseRepository
 from src.utils.date_util import DateUtil
 
@@ -17,8 +17,7 @@ class DoctorScheduleRepository(BaseRepository[DoctorSchedule]):
     
     def __init__(self):
         """Initialize doctor schedule repository"""
-        data_file = os.path.join("data", "doctor_schedules.csv")
-        super().__init__(data_file, DoctorSchedule)
+        super().__init__(DOCTOR_SCHEDULES_FILE, DoctorSchedule)
     
     def get_by_doctor(self, doctor_id: int) -> List[DoctorSchedule]:
         """Get schedules by doctor ID
@@ -108,7 +107,7 @@ class DoctorScheduleRepository(BaseRepository[DoctorSchedule]):
             DoctorSchedule: Created schedule
         """
         # Create a new schedule with all time slots available
-        time_slots = DateUtil.time_slots_to_hex(list(range(1, 17)))
+        time_slots = DateUtil.time_slots_to_hex([slot + 1 for slot in SLOT_INDICES])
         schedule = DoctorSchedule(
             id=None,
             doctor_id=doctor_id, 
@@ -5,10 +5,10 @@
 Notification Repository Class
 """
 
-import os
 from typing import List, Optional
 from datetime import datetime
 from src.entities.notification import Notification
+from src.config import NOTIFICATIONS_FILE
 from src.repositories.base_repository import BaseRepository
 
 class NotificationRepository(BaseRepository[Notification]):
@@ -16,8 +16,7 @@ class NotificationRepository(BaseRepository[Notification]):
     
     def __init__(self):
         """Initialize notification repository"""
-        data_file = os.path.join("data", "notifications.csv")
-        super().__init__(data_file, Notification)
+        super().__init__(NOTIFICATIONS_FILE, Notification)
     
     def get_by_user(self, user_id: int) -> List[Notification]:
         """Get notifications by user ID
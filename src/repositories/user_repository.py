@@ -5,9 +5,9 @@
 User Repository Class
 """
 
-import os
 from typing import List, Optional
 from src.entities.user import User
+from src.config import USERS_FILE
 from src.repositories.base_repository import BaseRepository
 
 class UserRepository(BaseRepository[User]):
@@ -15,8 +15,7 @@ class UserRepository(BaseRepository[User]):
     
     def __init__(self):
         """Initialize user repository"""
-        data_file = os.path.join("data", "users.csv")
-        super().__init__(data_file, User)
+        super().__init__(USERS_FILE, User)
     
     def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email
@@ -27,13 +26,7 @@ class UserRepository(BaseRepository[User]):
         Returns:
             Optional[User]: User if found, None otherwise
         """
-        users = self.get_all()
-        
-        for user in users:
-            if user.email == email:
-                return user
-        
-        return None
+        return self._find_by("email", email)
     
     def get_patients(self) -> List[User]:
         """Get all patients
@@ -80,7 +73,7 @@ class UserRepository(BaseRepository[User]):
         from src.utils.file_util import FileUtil
 
         # Read current CSV file to get available field names
-        existing_data = FileUtil.read_csv(self.data_file)
+        existing_data = self._read_rows()
         if not existing_data:
             return False
         
@@ -91,8 +84,10 @@ class UserRepository(BaseRepository[User]):
         user_dict = user.to_dict()
         update_data = {k: v for k, v in user_dict.items() if k in available_fields}
         
-        return FileUtil.update_row(
+        updated = FileUtil.update_row(
             self.data_file,
             lambda row: row.get("id") == str(user.id),
             update_data
         )
+        self._invalidate_rows()
+        return updated
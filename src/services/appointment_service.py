@@ -5,8 +5,9 @@
 Appointment Service Class - Handles business logic for appointments
 """
 
-from typing import List, Optional, Tuple, Dict, Any
-from datetime import datetime
+import os
+from typing import List, Optional, Tuple, Dict, Any, Callable, Iterable
+from datetime import date, datetime
 
 from src.entities.user import User
 from src.entities.appointment import Appointment
@@ -18,6 +19,28 @@ from src.repositories.notification_repository import NotificationRepository
 from src.repositories.doctor_schedule_repository import DoctorScheduleRepository
 from src.repositories.user_repository import UserRepository
 from src.utils.date_util import DateUtil
+from src.config import SLOT_MASK, STATUS, APPOINTMENTS_FILE, CLINICS_FILE, DOCTORS_FILE, USERS_FILE
+
+# Data files appointment query results are built from
+RESULT_DATA_FILES = (APPOINTMENTS_FILE, CLINICS_FILE, DOCTORS_FILE)
+
+
+def _file_mtime(path) -> int:
+    """Get a file's modification time
+    
+    Args:
+        path: File path
+        
+    Returns:
+        int: Modification time in nanoseconds, 0 if the file does not exist
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+# Display row for an available time slot, numbered from 1 for selection
+SLOT_ROW_FMT = "{index:2}. {date:<12} {day_of_week:<10} {clinic_name:<15} {doctor_name:<15} {time_str}"
 
 
 class AppointmentService:
@@ -31,6 +54,99 @@ class AppointmentService:
         self.__schedule_repo = DoctorScheduleRepository()
         self.__notification_repo = NotificationRepository()
         self.__user_repo = UserRepository()
+        # Appointment query results keyed by query arguments, stored as (data mtime, result)
+        self.__result_cache: Dict[Tuple, Tuple[int, List[Dict]]] = {}
+        # Clinic/doctor/user by ID, loaded on first lookup and stored as (file mtime, map)
+        self.__clinic_map = None
+        self.__doctor_map = None
+        self.__user_map = None
+    
+    def get_data_mtime(self) -> int:
+        """Get the latest modification time of the data files query results are built from
+        
+        Returns:
+            int: Modification time in nanoseconds
+        """
+        return max(_file_mtime(path) for path in RESULT_DATA_FILES)
+    
+    def _cached_result(self, key: Tuple, loader: Callable[[], List[Dict]]) -> List[Dict]:
+        """Return a cached query result, running the loader on a miss or once the data files change
+        
+        Args:
+            key (Tuple): Hashable query key
+            loader (Callable[[], List[Dict]]): Function computing the result
+            
+        Returns:
+            List[Dict]: Copy of the query result, callers may modify its rows and appointments freely
+        """
+        mtime = self.get_data_mtime()
+        entry = self.__result_cache.get(key)
+        if entry is None or entry[0] != mtime:
+            entry = (mtime, loader())
+            self.__result_cache[key] = entry
+        return self._copy_rows(entry[1])
+    
+    @staticmethod
+    def _copy_rows(rows: List[Dict]) -> List[Dict]:
+        """Copy result rows, including the appointment each row carries
+        
+        Args:
+            rows (List[Dict]): Result rows
+            
+        Returns:
+            List[Dict]: New rows with fresh appointment objects
+        """
+        copies = []
+        for row in rows:
+            row = dict(row)
+            appointment = row.get("appointment_obj")
+            if appointment is not None:
+                row["appointment_obj"] = Appointment.from_dict(appointment.to_dict())
+            copies.append(row)
+        return copies
+    
+    def clear_result_cache(self) -> None:
+        """Drop cached appointment query results"""
+        self.__result_cache.clear()
+    
+    def _clinic_map(self) -> Dict[int, Any]:
+        """Get clinics keyed by ID, re-read from the repository only when the file changes
+        
+        Returns:
+            Dict[int, Any]: Clinic ID to clinic
+        """
+        mtime = _file_mtime(CLINICS_FILE)
+        if self.__clinic_map is None or self.__clinic_map[0] != mtime:
+            self.__clinic_map = (mtime, {clinic.id: clinic for clinic in self.__clinic_repo.get_all()})
+        return self.__clinic_map[1]
+    
+    def _doctor_map(self) -> Dict[int, Any]:
+        """Get doctors keyed by ID, re-read from the repository only when the file changes
+        
+        Returns:
+            Dict[int, Any]: Doctor ID to doctor
+        """
+        mtime = _file_mtime(DOCTORS_FILE)
+        if self.__doctor_map is None or self.__doctor_map[0] != mtime:
+            self.__doctor_map = (mtime, {doctor.id: doctor for doctor in self.__doctor_repo.get_all()})
+        return self.__doctor_map[1]
+    
+    def _user_map(self) -> Dict[int, User]:
+        """Get users keyed by ID, re-read from the repository only when the file changes
+        
+        Returns:
+            Dict[int, User]: User ID to user
+        """
+        mtime = _file_mtime(USERS_FILE)
+        if self.__user_map is None or self.__user_map[0] != mtime:
+            self.__user_map = (mtime, {user.id: user for user in self.__user_repo.get_all()})
+        return self.__user_map[1]
+    
+    def clear_lookup_cache(self) -> None:
+        """Drop the clinic/doctor/user lookups so they are reloaded on next use"""
+        self.__clinic_map = None
+        self.__doctor_map = None
+        self.__user_map = None
     
     def get_all_clinics(self) -> List:
         """Get all clinics
@@ -49,7 +165,7 @@ class AppointmentService:
         Returns:
             Clinic: Clinic object
         """
-        return self.__clinic_repo.get_by_id(clinic_id)
+        return self._clinic_map().get(clinic_id)
     
     def get_all_doctors(self) -> List:
         """Get all doctors
@@ -79,7 +195,7 @@ class AppointmentService:
         Returns:
             Doctor: Doctor object
         """
-        return self.__doctor_repo.get_by_id(doctor_id)
+        return self._doctor_map().get(doctor_id)
     
     def get_date_range(self, start_date: str, days: int) -> List[str]:
         """Get date range
@@ -93,6 +209,18 @@ class AppointmentService:
         """
         return DateUtil.get_date_range(start_date, days)
     
+    def get_date_rows(self, start_date: date, days: int) -> List[Tuple[date, str, str]]:
+        """Get date range with ISO strings and day names
+        
+        Args:
+            start_date (date): Start date
+            days (int): Number of days
+            
+        Returns:
+            List[Tuple[date, str, str]]: List of (date, "YYYY-MM-DD", day of week) tuples
+        """
+        return DateUtil.get_date_rows(start_date, days)
+    
     def get_current_date(self) -> str:
         """Get current date
         
@@ -152,24 +280,23 @@ class AppointmentService:
         if not doctor_schedule:
             doctor_schedule = self.__schedule_repo.create_default_schedule(doctor_id, clinic_id)
         
-        # Get available time slots from doctor's schedule
-        available_slots_base = DateUtil.hex_to_time_slots(doctor_schedule.time_slots)
+        # Schedule bitmap, bit i set when time slot i + 1 is worked
+        schedule_mask = doctor_schedule.time_slots_int & SLOT_MASK
         
-        # If doctor has no available time slots, return empty list
-        if not available_slots_base:
-            return []
+        # Slots that are worked and not already booked that day
+        free = schedule_mask & ~self.__appointment_repo.get_booked_slots_bitmap(doctor_id, date)
         
-        # Check if each time slot in the schedule is available on that date
         available_slots = []
-        for slot in available_slots_base:
-            if self.__appointment_repo.is_slot_available(doctor_id, clinic_id, date, slot):
-                available_slots.append(slot)
+        while free:
+            lowest = free & -free
+            available_slots.append(lowest.bit_length())  # Bit i is time slot i + 1
+            free ^= lowest
         
         return available_slots
     
     def get_available_slots_data(self, clinic_id: Optional[int] = None, 
                                doctor_id: Optional[int] = None, 
-                               date: Optional[str] = None) -> List[Tuple]:
+                               date: Optional[str] = None) -> Tuple[List[Tuple[str, int, int, int]], List[str]]:
         """Get available time slots data
         
         Args:
@@ -178,60 +305,56 @@ class AppointmentService:
             date (Optional[str]): Date
             
         Returns:
-            List[Tuple]: List of tuples (date, time_slot, doctor_id, clinic_id, clinic_name, doctor_name, day_of_week, time_string)
+            Tuple[List[Tuple[str, int, int, int]], List[str]]: Slot keys (date, time_slot, doctor_id, clinic_id)
+                and the matching display rows, in the same order
         """
-        # If date not specified, get dates for the next 7 days
+        # Candidate dates with their day names, looked up once rather than per doctor/clinic pair.
+        # If date not specified, use the next 7 days, walked from today without re-parsing each date
         if date is None:
-            today = DateUtil.get_current_date()
-            future_dates = DateUtil.get_date_range(today, 7)
+            date_days = [(date_str, day_of_week)
+                         for _, date_str, day_of_week in DateUtil.get_date_rows(datetime.now().date(), 7)]
         else:
-            future_dates = [date]
+            date_days = [(date, DateUtil.get_day_of_week(date))]
         
-        # If clinic not specified, get all clinics
-        if clinic_id is None:
-            clinics = self.__clinic_repo.get_all()
-            clinic_ids = [clinic.id for clinic in clinics]
-        else:
-            clinic_ids = [clinic_id]
+        clinic_map = self._clinic_map()
+        doctor_map = self._doctor_map()
         
-        # If doctor not specified, get all doctors
+        # Candidate doctors, all of them if doctor not specified
         if doctor_id is None:
-            doctors = self.__doctor_repo.get_all()
-            doctor_ids = [doctor.id for doctor in doctors]
+            doctors = doctor_map.values()
         else:
-            doctor_ids = [doctor_id]
-        
-        available_slots_data = []
-        
-        # Iterate through all combinations
-        for d_id in doctor_ids:
-            doctor = self.__doctor_repo.get_by_id(d_id)
-            if not doctor:
+            doctors = (doctor_map[doctor_id],) if doctor_id in doctor_map else ()
+        
+        # Resolve (doctor, clinic) pairs up front from each doctor's own assigned clinics,
+        # so clinics a doctor does not work at are never visited; listed in clinic order
+        clinic_order = {c_id: position for position, c_id in enumerate(clinic_map)}
+        candidate_pairs = []
+        for doctor in doctors:
+            if clinic_id is None:
+                c_ids = {c_id for c_id in doctor.assigned_clinics if c_id in clinic_order}
+            elif clinic_id in clinic_order and clinic_id in doctor.assigned_clinics:
+                c_ids = (clinic_id,)
+            else:
                 continue
-                
-            for c_id in clinic_ids:
-                # Check if doctor works at this clinic
-                if c_id not in doctor.assigned_clinics:
-                    continue
-                    
-                clinic = self.__clinic_repo.get_by_id(c_id)
-                if not clinic:
-                    continue
-                    
-                for date_str in future_dates:
-                    day_of_week = DateUtil.get_day_of_week(date_str)
-                    
-                    # Get available time slots
-                    available_slots = self.get_available_time_slots(d_id, c_id, date_str)
-                    
-                    if available_slots:
-                        for slot in available_slots:
-                            time_str = DateUtil.get_time_slot_str(slot)
-                            available_slots_data.append(
-                                (date_str, slot, d_id, c_id, clinic.name, doctor.full_name, day_of_week, time_str)
-                            )
-        
-        return available_slots_data
+            for c_id in sorted(c_ids, key=clinic_order.__getitem__):
+                candidate_pairs.append((doctor, clinic_map[c_id]))
+        
+        slot_keys = []
+        rows = []
+        
+        for doctor, clinic in candidate_pairs:
+            d_id = doctor.id
+            c_id = clinic.id
+            for date_str, day_of_week in date_days:
+                # Get available time slots
+                for slot in self.get_available_time_slots(d_id, c_id, date_str):
+                    time_str = DateUtil.get_time_slot_str(slot)
+                    slot_keys.append((date_str, slot, d_id, c_id))
+                    rows.append(SLOT_ROW_FMT.format(
+                        index=len(rows) + 1, date=date_str, day_of_week=day_of_week,
+                        clinic_name=clinic.name, doctor_name=doctor.full_name, time_str=time_str))
+        
+        return slot_keys, rows
     
     def make_appointment(self, user_id: int, doctor_id: int, clinic_id: int, 
                        date: str, time_slot: int, reason: str) -> Appointment:
@@ -279,15 +402,16 @@ class AppointmentService:
             date=date,
             time_slot=time_slot,
             reason=reason,
-            status="Scheduled"
+            status=STATUS.SCHEDULED
         )
         
         # Add appointment
         appointment = self.__appointment_repo.add_appointment(appointment)
+        self.clear_result_cache()
         
         # Get related entities for notification
-        doctor = self.__doctor_repo.get_by_id(doctor_id)
-        clinic = self.__clinic_repo.get_by_id(clinic_id)
+        doctor = self._doctor_map().get(doctor_id)
+        clinic = self._clinic_map().get(clinic_id)
         
         # Create notification
         notification = Notification(
@@ -312,24 +436,34 @@ class AppointmentService:
         Returns:
             List[Dict]: List of appointment information dictionaries
         """
-        # Get appointments
-        appointments = self.__appointment_repo.get_by_user(user_id)
+        today = DateUtil.get_current_date()
+        return self._cached_result(
+            ("user", user_id, future_only, history_only, today),
+            lambda: self._load_user_appointments(user_id, future_only, history_only, today))
+    
+    def _load_user_appointments(self, user_id: int, future_only: bool, history_only: bool, today: str) -> List[Dict]:
+        """Load user appointments from the repository
         
-        if not appointments:
-            return []
+        Args:
+            user_id (int): User ID
+            future_only (bool): Whether to return only future appointments
+            history_only (bool): Whether to return only past appointments
+            today (str): Current date in YYYY-MM-DD format
+            
+        Returns:
+            List[Dict]: List of appointment information dictionaries
+        """
+        # Get appointments, date window applied by the repository
+        appointments = self.__appointment_repo.get_by_user_filtered(
+            user_id,
+            date_from=today if future_only else None,
+            date_before=today if history_only else None)
         
-        # Filter appointments
-        today = DateUtil.get_current_date()
         filtered_appointments = []
         
         for appointment in appointments:
-            if future_only and appointment.date < today:
-                continue
-            if history_only and appointment.date >= today:
-                continue
-            
-            clinic = self.__clinic_repo.get_by_id(appointment.clinic_id)
-            doctor = self.__doctor_repo.get_by_id(appointment.doctor_id)
+            clinic = self._clinic_map().get(appointment.clinic_id)
+            doctor = self._doctor_map().get(appointment.doctor_id)
             
             clinic_name = clinic.name if clinic else "Unknown Clinic"
             doctor_name = doctor.full_name if doctor else "Unknown Doctor"
@@ -376,9 +510,20 @@ class AppointmentService:
         if not appointment:
             return None
         
-        clinic = self.__clinic_repo.get_by_id(appointment.clinic_id)
-        doctor = self.__doctor_repo.get_by_id(appointment.doctor_id)
-        user = self.__user_repo.get_by_id(appointment.user_id)
+        return self.build_appointment_details(appointment)
+    
+    def build_appointment_details(self, appointment: Appointment) -> Dict:
+        """Build appointment details for an appointment already in memory
+        
+        Args:
+            appointment (Appointment): Appointment object
+            
+        Returns:
+            Dict: Appointment details dictionary
+        """
+        clinic = self._clinic_map().get(appointment.clinic_id)
+        doctor = self._doctor_map().get(appointment.doctor_id)
+        user = self._user_map().get(appointment.user_id)
         
         details = {
             "id": appointment.id,
@@ -395,7 +540,7 @@ class AppointmentService:
             "doctor_name": doctor.full_name if doctor else "Unknown Doctor",
             "reason": appointment.reason,
             "status": appointment.status,
-            "can_cancel": appointment.is_scheduled() and appointment.date >= DateUtil.get_current_date(),
+            "can_cancel": appointment.is_scheduled() and appointment.date_key >= DateUtil.date_key(DateUtil.get_current_date()),
             "appointment_obj": appointment  # Include original object for operations
         }
         
@@ -412,6 +557,8 @@ class AppointmentService:
         """
         # Cancel appointment
         if self.__appointment_repo.cancel_appointment(appointment):
+            self.clear_result_cache()
+            
             # Create notification
             notification = Notification(
                 user_id=appointment.user_id,
@@ -426,35 +573,46 @@ class AppointmentService:
         
         return False
     
-    def filter_appointments(self, user_id: int, params: Dict[str, Any]) -> List[Dict]:
+    def filter_appointments(self, user_id: Optional[int], params: Dict[str, Any]) -> List[Dict]:
         """Filter appointments
         
         Args:
-            user_id (int): User ID
+            user_id (Optional[int]): User ID, None (or -1) for all users (admin)
             params (Dict[str, Any]): Filter parameters
             
         Returns:
             List[Dict]: List of appointment information dictionaries
         """
-        # Admin user (ID -1) can view all appointments
         if user_id == -1:
-            appointments = self.__appointment_repo.get_all()
-        else:
-            # Regular users can only view their own appointments
-            appointments = self.__appointment_repo.get_by_user(user_id)
+            user_id = None
+        
+        def load() -> List[Dict]:
+            # No user ID means no user restriction, the repository skips that check entirely
+            appointments = self.__appointment_repo.get_by_user_filtered(
+                user_id,
+                clinic_id=params.get('clinic_id'),
+                doctor_id=params.get('doctor_id'),
+                date=params.get('date'))
+            return self._appointment_rows(appointments)
+        
+        return self._cached_result(("filter", user_id, frozenset(params.items())), load)
+    
+    def _appointment_rows(self, appointments: Iterable[Appointment]) -> List[Dict]:
+        """Build appointment information dictionaries for listing
+        
+        Args:
+            appointments (Iterable[Appointment]): Appointments to list
+            
+        Returns:
+            List[Dict]: List of appointment information dictionaries
+        """
+        clinic_map = self._clinic_map()
+        doctor_map = self._doctor_map()
         
-        # Filter appointments
         filtered_appointments = []
         for appointment in appointments:
-            if 'clinic_id' in params and params['clinic_id'] is not None and appointment.clinic_id != params['clinic_id']:
-                continue
-            if 'doctor_id' in params and params['doctor_id'] is not None and appointment.doctor_id != params['doctor_id']:
-                continue
-            if 'date' in params and params['date'] is not None and appointment.date != params['date']:
-                continue
-            
-            clinic = self.__clinic_repo.get_by_id(appointment.clinic_id)
-            doctor = self.__doctor_repo.get_by_id(appointment.doctor_id)
+            clinic = clinic_map.get(appointment.clinic_id)
+            doctor = doctor_map.get(appointment.doctor_id)
             
             clinic_name = clinic.name if clinic else "Unknown Clinic"
             doctor_name = doctor.full_name if doctor else "Unknown Doctor"
@@ -524,11 +682,13 @@ class AppointmentService:
     def get_all_appointments(self) -> List[Dict]:
         """Get all appointments in the system (admin view)"""
         appointments = self.__appointment_repo.get_all()
+        clinic_map = self._clinic_map()
+        doctor_map = self._doctor_map()
 
         result = []
         for appointment in appointments:
-            clinic = self.__clinic_repo.get_by_id(appointment.clinic_id)
-            doctor = self.__doctor_repo.get_by_id(appointment.doctor_id)
+            clinic = clinic_map.get(appointment.clinic_id)
+            doctor = doctor_map.get(appointment.doctor_id)
             result.append({
                 "id": appointment.id,
                 "user_id": appointment.user_id,
@@ -537,6 +697,7 @@ class AppointmentService:
                 "time_str": DateUtil.get_time_slot_str(appointment.time_slot),
                 "clinic_name": clinic.name if clinic else "Unknown",
                 "doctor_name": doctor.full_name if doctor else "Unknown",
-                "status": appointment.status
+                "status": appointment.status,
+                "appointment_obj": appointment  # Include original object for operations
             })
         return result
@@ -8,8 +8,10 @@ Utility module initialization file
 from src.utils.id_generator import IdGenerator
 from src.utils.file_util import FileUtil
 from src.utils.date_util import DateUtil
+from src.utils.screen_util import ScreenUtil
 
 __all__ = [
     'FileUtil',
-    'DateUtil'
+    'DateUtil',
+    'ScreenUtil'
 ] 
@@ -5,8 +5,10 @@
 Date utility class, provides date and time slot related operations
 """
 
-from datetime import datetime, timedelta
-from typing import List, Dict, Tuple
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
+from src.config import HEX_TIME_SLOTS, slot_mask
 
 class DateUtil:
     """Date utility class, provides date and time slot related operations"""
@@ -31,6 +33,9 @@ class DateUtil:
         16: "4:30 PM - 5:00 PM"
     }
     
+    # Day names indexed by date.weekday()
+    WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+    
     @staticmethod
     def get_time_slot_str(time_slot: int) -> str:
         """Get string representation of time slot
@@ -80,14 +85,56 @@ class DateUtil:
         Returns:
             List[str]: List of dates
         """
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        date_list = []
+        # Parse once, then step by whole days; isoformat gives the same "YYYY-MM-DD" as strftime
+        start = datetime.strptime(start_date, "%Y-%m-%d").date()
+        return [(start + timedelta(days=i)).isoformat() for i in range(days)]
+    
+    @staticmethod
+    def get_date_rows(start_date: date, days: int) -> List[Tuple[date, str, str]]:
+        """Get date range with ISO strings and day names
+        
+        Args:
+            start_date (date): Start date
+            days (int): Number of days
+            
+        Returns:
+            List[Tuple[date, str, str]]: List of (date, "YYYY-MM-DD", day of week) tuples
+        """
+        rows = []
         
         for i in range(days):
-            date = start + timedelta(days=i)
-            date_list.append(date.strftime("%Y-%m-%d"))
+            day = start_date + timedelta(days=i)
+            rows.append((day, day.isoformat(), DateUtil.WEEKDAY_NAMES[day.weekday()]))
         
-        return date_list
+        return rows
+    
+    @staticmethod
+    def parse_date(date_str: str) -> Optional[date]:
+        """Parse date string
+        
+        Args:
+            date_str (str): Date in format "YYYY-MM-DD"
+            
+        Returns:
+            Optional[date]: Parsed date, None if date is invalid
+        """
+        try:
+            return datetime.strptime(date_str, "%Y-%m-%d").date()
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def date_key(date_str: str) -> int:
+        """Convert a date string to an integer that orders the same way
+        
+        Args:
+            date_str (str): Date in format "YYYY-MM-DD"
+            
+        Returns:
+            int: Date as YYYYMMDD, 0 if date_str is empty or malformed
+        """
+        digits = date_str.replace("-", "") if date_str else ""
+        return int(digits) if digits.isdecimal() else 0
     
     @staticmethod
     def is_future_date(date_str: str) -> bool:
@@ -141,6 +188,7 @@ class DateUtil:
             return date_str
     
     @staticmethod
+    @lru_cache(maxsize=512)
     def get_day_of_week(date_str: str) -> str:
         """Get day of week
         
@@ -152,8 +200,7 @@ class DateUtil:
         """
         try:
             date = datetime.strptime(date_str, "%Y-%m-%d")
-            days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-            return days[date.weekday()]
+            return DateUtil.WEEKDAY_NAMES[date.weekday()]
         except ValueError:
             return "Unknown"
     
@@ -174,7 +221,7 @@ class DateUtil:
         for slot in time_slots:
             if 1 <= slot <= 16:
                 # Since time slots are 1-16 and bits are 0-15, need to subtract 1
-                value |= (1 << (slot - 1))
+                value |= slot_mask(slot - 1)
         
         return format(value, 'x')
     
@@ -195,8 +242,8 @@ class DateUtil:
             value = int(hex_str, 16)
             slots = []
             
-            for i in range(16):
-                if value & (1 << i):
+            for i, bit in enumerate(HEX_TIME_SLOTS):
+                if value & bit:
                     # Since bits are 0-15 and time slots are 1-16, need to add 1
                     slots.append(i + 1)
             
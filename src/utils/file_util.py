@@ -76,19 +76,25 @@ class FileUtil:
                 pass
             return True
         
+        # Written to a temporary file that then replaces the original, so a failed
+        # write leaves the previous contents intact instead of a truncated file
+        temp_path = f"{file_path}.tmp"
         try:
             # Get all fields
             fieldnames = data[0].keys()
             
             # Write to CSV file
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            with open(temp_path, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
                 writer.writerows(data)
+            os.replace(temp_path, file_path)
             
             return True
         except Exception as e:
             print(f"Error writing to file {file_path}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
             return False
     
     @staticmethod
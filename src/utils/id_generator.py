@@ -7,7 +7,8 @@ ID Generator utility class, used to generate unique identifiers for entities
 
 import os
 import csv
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
+from src.config import DATA_DIR
 
 class IdGenerator:
     """ID Generator utility class, used to generate unique identifiers for entities"""
@@ -16,11 +17,11 @@ class IdGenerator:
     __max_ids: Dict[str, int] = {}
     
     @classmethod
-    def initialize(cls, data_dir: str = "data") -> None:
+    def initialize(cls, data_dir: Union[str, os.PathLike] = DATA_DIR) -> None:
         """Initialize ID generator, get maximum ID for each entity type
         
         Args:
-            data_dir (str, optional): Data directory. Defaults to "data".
+            data_dir (Union[str, os.PathLike], optional): Data directory. Defaults to DATA_DIR.
         """
         # Ensure data directory exists
         if not os.path.exists(data_dir):
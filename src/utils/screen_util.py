@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Screen utility class, provides terminal screen operations
+"""
+
+import os
+import sys
+
+# Erase display and move cursor home
+_ANSI_CLEAR = "\x1b[2J\x1b[H"
+
+# Screen clearing strategies
+_CLEAR_NONE = 0   # Output is not a terminal, nothing to clear
+_CLEAR_ANSI = 1   # Write _ANSI_CLEAR
+_CLEAR_SHELL = 2  # Run cls/clear
+
+class ScreenUtil:
+    """Screen utility class, provides terminal screen operations"""
+    
+    # How to clear the screen (_CLEAR_NONE/_CLEAR_ANSI/_CLEAR_SHELL), detected on first clear_screen
+    __clear_mode = None
+    
+    @staticmethod
+    def _detect_clear_mode() -> int:
+        """Choose how the screen should be cleared for the current output
+        
+        Returns:
+            int: _CLEAR_NONE when output is redirected, _CLEAR_SHELL for dumb terminals,
+                 otherwise _CLEAR_ANSI
+        """
+        if not sys.stdout.isatty():
+            return _CLEAR_NONE
+        term = os.environ.get('TERM', '')
+        if term == 'dumb':
+            return _CLEAR_SHELL
+        # Windows 10+ consoles handle escapes once virtual terminal processing is on,
+        # which running an empty command enables for the rest of the process
+        if os.name == 'nt' and not term and 'WT_SESSION' not in os.environ:
+            os.system('')
+        return _CLEAR_ANSI
+    
+    @classmethod
+    def clear_screen(cls) -> None:
+        """Clear screen"""
+        if cls.__clear_mode is None:
+            cls.__clear_mode = cls._detect_clear_mode()
+        if cls.__clear_mode == _CLEAR_ANSI:
+            # Left buffered so it goes out together with whatever is written next
+            sys.stdout.write(_ANSI_CLEAR)
+        elif cls.__clear_mode == _CLEAR_SHELL:
+            os.system('cls' if os.name == 'nt' else 'clear')